@@ -10,8 +10,8 @@ from datetime import datetime
 
 from src.models import ConnectivityPoint, SpeedTest, QualityScore
 from src.utils import (
-    load_data, save_data, generate_report, simulate_router_impact,
-    generate_map, analyze_temporal_evolution, validate_coordinates,
+    load_data, save_data, dumps_json, generate_report, simulate_router_impact,
+    generate_map, analyze_temporal_evolution,
 
     generate_ml_report
 
@@ -97,12 +97,6 @@ def import_csv(csv_path: str, output_path: str = 'src/data/pontos.json', country
                     jitter = float(row.get('jitter', 0))
                     packet_loss = float(row.get('packet_loss', 0))
                     
-                    # Additional validation for coordinates
-                    if not validate_coordinates(lat, lon):
-                        logger.warning(f"Row {row_num}: Invalid coordinates ({lat}, {lon}), skipping")
-                        skipped_count += 1
-                        continue
-                    
                     # Create SpeedTest
                     speed_test = SpeedTest(
                         download=download,
@@ -123,7 +117,7 @@ def import_csv(csv_path: str, output_path: str = 'src/data/pontos.json', country
                     )
                     
                     points.append(point.to_dict())
-                    logger.debug(f"Imported point: {point}")
+                    logger.debug("Imported point: %s", point)
                     
                 except ValueError as e:
                     error_msg = f"Row {row_num}: Invalid numeric value - {e}"
@@ -413,10 +407,8 @@ Examples:
         print("\n" + "=" * 80 + "\n")
         
         # Save ML analysis to JSON
-        import json
         ml_output_path = 'ml_analysis_report.json'
-        with open(ml_output_path, 'w', encoding='utf-8') as f:
-            json.dump(ml_report, f, indent=2, ensure_ascii=False)
+        Path(ml_output_path).write_bytes(dumps_json(ml_report))
         logger.info(f"ML analysis saved to {ml_output_path}")
         print(f"✓ ML analysis report saved to {ml_output_path}\n")
     
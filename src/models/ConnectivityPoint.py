@@ -2,10 +2,29 @@
 
 from typing import Dict, Optional
 from datetime import datetime
+import time
 import uuid
 from .SpeedTest import SpeedTest
 from .QualityScore import QualityScore
 
+# Default timestamp cache, refreshed at most once per wall-clock second
+_last_ts_int = 0
+_last_ts_str = ''
+
+
+def _now_iso() -> str:
+    """Get the current local time as an ISO format string with second resolution.
+    
+    Returns:
+        str: ISO format timestamp, shared by all points created within the same second
+    """
+    global _last_ts_int, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_int:
+        _last_ts_int = now
+        _last_ts_str = datetime.fromtimestamp(now).isoformat()
+    return _last_ts_str
+
 
 class ConnectivityPoint:
     """Represents a connectivity measurement point with location and quality data.
@@ -21,6 +40,8 @@ class ConnectivityPoint:
         country (str): ISO 3166-1 alpha-2 country code (e.g., 'BR', 'US')
     """
     
+    __slots__ = ('latitude', 'longitude', 'provider', 'speed_test', 'quality_score', 'timestamp', 'id', 'country')
+    
     def __init__(
         self,
         latitude: float,
@@ -49,7 +70,7 @@ class ConnectivityPoint:
         self.provider = provider
         self.speed_test = speed_test
         self.quality_score = quality_score if quality_score else QualityScore.calculate(speed_test)
-        self.timestamp = timestamp if timestamp else datetime.now().isoformat()
+        self.timestamp = timestamp if timestamp else _now_iso()
         self.id = point_id if point_id else str(uuid.uuid4())
         self.country = country.upper() if country else "BR"
     
@@ -80,28 +101,22 @@ class ConnectivityPoint:
         Returns:
             ConnectivityPoint: New ConnectivityPoint instance
         """
-        speed_test = SpeedTest.from_dict(data.get('speed_test', {}))
+        get = data.get
+        speed_test = SpeedTest.from_dict(get('speed_test', {}))
         
         # If quality_score exists in dict, use it; otherwise it will be auto-calculated
-        quality_score = None
-        if 'quality_score' in data:
-            qs_data = data['quality_score']
-            quality_score = QualityScore(
-                overall_score=qs_data.get('overall_score', 0.0),
-                speed_score=qs_data.get('speed_score', 0.0),
-                latency_score=qs_data.get('latency_score', 0.0),
-                stability_score=qs_data.get('stability_score', 0.0)
-            )
+        qs_data = get('quality_score')
+        quality_score = QualityScore.from_dict(qs_data) if qs_data is not None else None
         
         return cls(
-            latitude=data.get('latitude', 0.0),
-            longitude=data.get('longitude', 0.0),
-            provider=data.get('provider', 'Unknown'),
+            latitude=get('latitude', 0.0),
+            longitude=get('longitude', 0.0),
+            provider=get('provider', 'Unknown'),
             speed_test=speed_test,
             quality_score=quality_score,
-            timestamp=data.get('timestamp'),
-            point_id=data.get('id'),
-            country=data.get('country', 'BR')
+            timestamp=get('timestamp'),
+            point_id=get('id'),
+            country=get('country', 'BR')
         )
     
     def __repr__(self) -> str:
@@ -0,0 +1,140 @@
+"""PointArray model for column-oriented bulk processing of connectivity points."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+
+
+@dataclass
+class PointArray:
+    """Structure-of-arrays view of many connectivity points.
+
+    Each attribute holds one column with one entry per point, so bulk
+    analytics can work on contiguous NumPy arrays instead of per-point dicts.
+
+    Attributes:
+        latitude (np.ndarray): Latitude coordinates
+        longitude (np.ndarray): Longitude coordinates
+        download (np.ndarray): Download speeds in Mbps
+        upload (np.ndarray): Upload speeds in Mbps
+        latency (np.ndarray): Latencies in milliseconds
+        jitter (np.ndarray): Jitter in milliseconds
+        packet_loss (np.ndarray): Packet loss percentages
+        obstruction (np.ndarray): Obstruction percentages
+        stability (np.ndarray): Connection stability scores (0-100)
+        quality_score (np.ndarray): Overall quality scores (0-100)
+        provider_code (np.ndarray): Integer provider codes indexing into providers
+        providers (List[str]): Provider names, in code order
+    """
+
+    latitude: np.ndarray
+    longitude: np.ndarray
+    download: np.ndarray
+    upload: np.ndarray
+    latency: np.ndarray
+    jitter: np.ndarray
+    packet_loss: np.ndarray
+    obstruction: np.ndarray
+    stability: np.ndarray
+    quality_score: np.ndarray
+    provider_code: np.ndarray
+    providers: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Number of points in the array.
+
+        Returns:
+            int: Point count
+        """
+        return len(self.latitude)
+
+    @classmethod
+    def from_dicts(cls, data: List[Dict]) -> 'PointArray':
+        """Create PointArray from connectivity point dictionaries.
+
+        Args:
+            data: List of connectivity point dictionaries
+
+        Returns:
+            PointArray: Column-oriented copy of the points
+        """
+        n = len(data)
+
+        def column(values) -> np.ndarray:
+            return np.fromiter(values, dtype=np.float64, count=n)
+
+        speed_tests = [point.get('speed_test', {}) for point in data]
+
+        codes: Dict[str, int] = {}
+        provider_code = np.fromiter(
+            (codes.setdefault(point.get('provider', 'Unknown'), len(codes)) for point in data),
+            dtype=np.int32,
+            count=n
+        )
+
+        return cls(
+            latitude=column(point.get('latitude', 0) for point in data),
+            longitude=column(point.get('longitude', 0) for point in data),
+            download=column(st.get('download', 0) for st in speed_tests),
+            upload=column(st.get('upload', 0) for st in speed_tests),
+            latency=column(st.get('latency', 0) for st in speed_tests),
+            jitter=column(st.get('jitter', 0) for st in speed_tests),
+            packet_loss=column(st.get('packet_loss', 0) for st in speed_tests),
+            obstruction=column(st.get('obstruction', 0) for st in speed_tests),
+            stability=column(st.get('stability', 0) for st in speed_tests),
+            quality_score=column(point.get('quality_score', {}).get('overall_score', 0) for point in data),
+            provider_code=provider_code,
+            providers=list(codes)
+        )
+
+    def provider_mask(self, provider: str) -> np.ndarray:
+        """Get a boolean mask selecting the points of one provider.
+
+        Args:
+            provider: Provider name
+
+        Returns:
+            np.ndarray: Boolean mask, all False if the provider is not present
+        """
+        if provider not in self.providers:
+            return np.zeros(len(self), dtype=bool)
+        return self.provider_code == self.providers.index(provider)
+
+    def provider_stats(self, columns: List[str]) -> Dict[str, Dict[str, np.ndarray]]:
+        """Reduce float columns per provider.
+
+        Points are sorted by provider once and every column's min and max are
+        reduced over the same contiguous groups.
+
+        Args:
+            columns: Names of float columns, e.g. ['download', 'latency']
+
+        Returns:
+            Dict[str, Dict[str, np.ndarray]]: 'mean', 'min' and 'max' arrays for
+            each column, indexed by provider code
+        """
+        counts = self.provider_counts()
+        # Codes come from the points themselves, so no provider group is empty
+        order = np.argsort(self.provider_code, kind='stable')
+        starts = np.cumsum(counts) - counts
+
+        stats = {}
+        for column in columns:
+            values = getattr(self, column)
+            grouped = values[order]
+            stats[column] = {
+                # bincount sums each group in point order, like the builtin sum()
+                'mean': np.bincount(self.provider_code, weights=values, minlength=len(counts)) / counts,
+                'min': np.minimum.reduceat(grouped, starts),
+                'max': np.maximum.reduceat(grouped, starts)
+            }
+        return stats
+
+    def provider_counts(self) -> np.ndarray:
+        """Count points per provider.
+
+        Returns:
+            np.ndarray: Point count indexed by provider code
+        """
+        return np.bincount(self.provider_code, minlength=len(self.providers))
@@ -1,5 +1,9 @@
 """QualityScore model for connectivity quality assessment."""
 
+from bisect import bisect_right
+
+import numpy as np
+
 from .SpeedTest import SpeedTest
 
 
@@ -14,16 +18,23 @@ class QualityScore:
         rating (str): Quality rating (Excellent/Good/Fair/Poor)
     """
 
+    __slots__ = ('overall_score', 'speed_score', 'latency_score', 'stability_score', 'rating')
+
     # Weight distribution for overall score calculation
     SPEED_WEIGHT = 0.40
     LATENCY_WEIGHT = 0.30
     STABILITY_WEIGHT = 0.30
+    SCORE_WEIGHTS = np.array([SPEED_WEIGHT, LATENCY_WEIGHT, STABILITY_WEIGHT])
 
     # Starlink 2026 target metrics
     TARGET_DOWNLOAD = 200.0  # Mbps
     TARGET_UPLOAD = 20.0     # Mbps
     TARGET_LATENCY = 20.0    # ms (lower is better)
 
+    # Lower bounds of the Fair/Good/Excellent ratings, in ascending order
+    RATING_THRESHOLDS = (40, 60, 80)
+    RATINGS = ("Poor", "Fair", "Good", "Excellent")
+
     def __init__(
         self,
         overall_score: float,
@@ -86,20 +97,33 @@ class QualityScore:
             stability_score=round(stability_score, 2)
         )
     
+    @classmethod
+    def calculate_batch(
+        cls,
+        speed_scores: np.ndarray,
+        latency_scores: np.ndarray,
+        stability_scores: np.ndarray
+    ) -> np.ndarray:
+        """Calculate overall scores for many points from their component scores.
+
+        Args:
+            speed_scores: Speed component scores (0-100)
+            latency_scores: Latency component scores (0-100)
+            stability_scores: Stability component scores (0-100)
+
+        Returns:
+            np.ndarray: Weighted overall score for each point
+        """
+        components = np.column_stack((speed_scores, latency_scores, stability_scores)).astype(np.float64, copy=False)
+        return components @ cls.SCORE_WEIGHTS
+
     def get_rating(self) -> str:
         """Get quality rating based on overall score.
 
         Returns:
             str: Rating string (Excellent/Good/Fair/Poor)
         """
-        if self.overall_score >= 80:
-            return "Excellent"
-        elif self.overall_score >= 60:
-            return "Good"
-        elif self.overall_score >= 40:
-            return "Fair"
-        else:
-            return "Poor"
+        return self.RATINGS[bisect_right(self.RATING_THRESHOLDS, self.overall_score)]
 
     def to_dict(self) -> dict:
         """Convert QualityScore to dictionary representation.
@@ -115,6 +139,26 @@ class QualityScore:
             'rating': self.rating
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QualityScore':
+        """Create QualityScore instance from dictionary.
+
+        The rating is always recomputed from the overall score.
+
+        Args:
+            data: Dictionary containing quality metrics
+
+        Returns:
+            QualityScore: New QualityScore instance
+        """
+        get = data.get
+        return cls(
+            overall_score=get('overall_score', 0.0),
+            speed_score=get('speed_score', 0.0),
+            latency_score=get('latency_score', 0.0),
+            stability_score=get('stability_score', 0.0)
+        )
+
     def __repr__(self) -> str:
         """String representation of QualityScore.
 
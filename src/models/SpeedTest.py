@@ -14,6 +14,8 @@ class SpeedTest:
         stability (float): Connection stability score (0-100)
     """
 
+    __slots__ = ('download', 'upload', 'latency', 'jitter', 'packet_loss', 'obstruction', 'stability')
+
     def __init__(
         self,
         download: float,
@@ -96,14 +98,15 @@ class SpeedTest:
         Returns:
             SpeedTest: New SpeedTest instance
         """
+        get = data.get
         return cls(
-            download=data.get('download', 0.0),
-            upload=data.get('upload', 0.0),
-            latency=data.get('latency', 0.0),
-            jitter=data.get('jitter', 0.0),
-            packet_loss=data.get('packet_loss', 0.0),
-            obstruction=data.get('obstruction', 0.0),
-            stability=data.get('stability')
+            download=get('download', 0.0),
+            upload=get('upload', 0.0),
+            latency=get('latency', 0.0),
+            jitter=get('jitter', 0.0),
+            packet_loss=get('packet_loss', 0.0),
+            obstruction=get('obstruction', 0.0),
+            stability=get('stability')
         )
 
     def __repr__(self) -> str:
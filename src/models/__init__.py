@@ -3,5 +3,6 @@
 from .SpeedTest import SpeedTest
 from .QualityScore import QualityScore
 from .ConnectivityPoint import ConnectivityPoint
+from .PointArray import PointArray
 
-__all__ = ['SpeedTest', 'QualityScore', 'ConnectivityPoint']
+__all__ = ['SpeedTest', 'QualityScore', 'ConnectivityPoint', 'PointArray']
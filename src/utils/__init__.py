@@ -1,9 +1,9 @@
 """Utils package for Rural Connectivity Mapper."""
 
 from .validation_utils import validate_coordinates, validate_speed_test, validate_provider, validate_csv_row
-from .data_utils import load_data, save_data, backup_data
+from .data_utils import load_data, save_data, backup_data, dumps_json
 from .measurement_utils import measure_speed
-from .geocoding_utils import geocode_coordinates, geocode_address
+from .geocoding_utils import geocode_coordinates, geocode_address, geocode_addresses
 from .report_utils import generate_report
 from .simulation_utils import simulate_router_impact
 from .mapping_utils import generate_map
@@ -85,9 +85,11 @@ __all__ = [
     'load_data',
     'save_data',
     'backup_data',
+    'dumps_json',
     'measure_speed',
     'geocode_coordinates',
     'geocode_address',
+    'geocode_addresses',
     'generate_report',
     'simulate_router_impact',
     'generate_map',
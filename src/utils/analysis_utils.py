@@ -9,9 +9,16 @@ from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
 
 from .i18n_utils import get_translation
+from ..models import PointArray
 
 logger = logging.getLogger(__name__)
 
+# Speed test fields summarized per provider by compare_providers
+PROVIDER_SPEED_TEST_FIELDS = [
+    'download', 'upload', 'latency', 'jitter', 'packet_loss', 'obstruction', 'stability'
+]
+PROVIDER_METRICS = ['quality_score'] + PROVIDER_SPEED_TEST_FIELDS
+
 
 def analyze_temporal_evolution(data: List[Dict], language: str = 'en') -> Dict:
     """Analyze temporal evolution of connectivity quality.
@@ -431,107 +438,30 @@ def compare_providers(data: List[Dict]) -> Dict:
             logger.warning("No data provided for provider comparison")
             return {'providers': {}}
         
-        # Collect metrics by provider
-        provider_metrics = defaultdict(lambda: {
-            'quality_scores': [],
-            'download_speeds': [],
-            'upload_speeds': [],
-            'latencies': [],
-            'jitters': [],
-            'packet_losses': [],
-            'obstructions': [],
-            'stabilities': []
-        })
-        
-        for point in data:
-            provider = point.get('provider', 'Unknown')
-            quality_score = point.get('quality_score', {})
-            speed_test = point.get('speed_test', {})
-            
-            provider_metrics[provider]['quality_scores'].append(
-                quality_score.get('overall_score', 0)
-            )
-            provider_metrics[provider]['download_speeds'].append(
-                speed_test.get('download', 0)
-            )
-            provider_metrics[provider]['upload_speeds'].append(
-                speed_test.get('upload', 0)
-            )
-            provider_metrics[provider]['latencies'].append(
-                speed_test.get('latency', 0)
-            )
-            provider_metrics[provider]['jitters'].append(
-                speed_test.get('jitter', 0)
-            )
-            provider_metrics[provider]['packet_losses'].append(
-                speed_test.get('packet_loss', 0)
-            )
-            provider_metrics[provider]['obstructions'].append(
-                speed_test.get('obstruction', 0)
-            )
-            provider_metrics[provider]['stabilities'].append(
-                speed_test.get('stability', 0)
-            )
-        
-        # Calculate statistics for each provider
-        providers_summary = {}
+        # Transpose once into per-metric columns, then reduce each provider group at once
+        points = PointArray.from_dicts(data)
+        counts = points.provider_counts()
+        metric_stats = points.provider_stats(PROVIDER_METRICS)
         
         def calculate_avg(lst):
             """Helper to calculate average of a list."""
             return round(sum(lst) / len(lst), 2) if lst else 0
         
-        def calculate_max(lst):
-            """Helper to calculate max of a list."""
-            return round(max(lst), 2) if lst else 0
-        
-        def calculate_min(lst):
-            """Helper to calculate min of a list."""
-            return round(min(lst), 2) if lst else 0
-        
-        for provider, metrics in provider_metrics.items():
-            providers_summary[provider] = {
-                'count': len(metrics['quality_scores']),
-                'quality_score': {
-                    'avg': calculate_avg(metrics['quality_scores']),
-                    'min': calculate_min(metrics['quality_scores']),
-                    'max': calculate_max(metrics['quality_scores'])
-                },
-                'download': {
-                    'avg': calculate_avg(metrics['download_speeds']),
-                    'min': calculate_min(metrics['download_speeds']),
-                    'max': calculate_max(metrics['download_speeds'])
-                },
-                'upload': {
-                    'avg': calculate_avg(metrics['upload_speeds']),
-                    'min': calculate_min(metrics['upload_speeds']),
-                    'max': calculate_max(metrics['upload_speeds'])
-                },
-                'latency': {
-                    'avg': calculate_avg(metrics['latencies']),
-                    'min': calculate_min(metrics['latencies']),
-                    'max': calculate_max(metrics['latencies'])
-                },
-                'jitter': {
-                    'avg': calculate_avg(metrics['jitters']),
-                    'min': calculate_min(metrics['jitters']),
-                    'max': calculate_max(metrics['jitters'])
-                },
-                'packet_loss': {
-                    'avg': calculate_avg(metrics['packet_losses']),
-                    'min': calculate_min(metrics['packet_losses']),
-                    'max': calculate_max(metrics['packet_losses'])
-                },
-                'obstruction': {
-                    'avg': calculate_avg(metrics['obstructions']),
-                    'min': calculate_min(metrics['obstructions']),
-                    'max': calculate_max(metrics['obstructions'])
-                },
-                'stability': {
-                    'avg': calculate_avg(metrics['stabilities']),
-                    'min': calculate_min(metrics['stabilities']),
-                    'max': calculate_max(metrics['stabilities'])
+        # Calculate statistics for each provider
+        providers_summary = {
+            provider: {
+                'count': int(counts[code]),
+                **{
+                    metric: {
+                        'avg': round(float(metric_stats[metric]['mean'][code]), 2),
+                        'min': round(float(metric_stats[metric]['min'][code]), 2),
+                        'max': round(float(metric_stats[metric]['max'][code]), 2)
+                    }
+                    for metric in PROVIDER_METRICS
                 }
             }
+            for code, provider in enumerate(points.providers)
+        }
         
         # Identify satellite providers (Starlink variants, Viasat, HughesNet)
         satellite_providers = [
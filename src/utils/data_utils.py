@@ -2,19 +2,81 @@
 
 import json
 import logging
-from typing import Any, List, Dict
+import math
+import os
+import stat
+import tempfile
+from typing import Any, BinaryIO, List, Dict, Union
 from pathlib import Path
 from datetime import datetime
 import shutil
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Process umask, read once at import; new data files get 0o666 minus it, as open() would
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, with orjson when available.
+    
+    orjson rejects the NaN/Infinity tokens that the json module accepts, so
+    such files are re-parsed with the json module.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check whether value holds a NaN or infinite float, at any nesting depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
 
-def load_data(filepath: str) -> List[Dict]:
+def dumps_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, with orjson when available.
+    
+    Both encoders write the same layout (2-space indent, non-ASCII kept as
+    is) and values that load back equal, but orjson spells some floats
+    differently (e.g. 1e16 where the json module writes 1e+16).
+    
+    Values orjson cannot encode (e.g. integers wider than 64 bits) fall back
+    to the json module, as does data holding NaN or Infinity, which orjson
+    would write as null. Non-finite floats can only be behind a null in
+    orjson's output, so other data is not searched for them.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            if b'null' not in raw or not _has_non_finite(data):
+                return raw
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def load_data(filepath: Union[str, BinaryIO]) -> List[Dict]:
     """Load JSON data from file.
     
     Args:
-        filepath: Path to JSON file
+        filepath: Path to JSON file, or an open binary file object to read from
         
     Returns:
         List[Dict]: Loaded data as list of dictionaries
@@ -24,14 +86,17 @@ def load_data(filepath: str) -> List[Dict]:
         json.JSONDecodeError: If file contains invalid JSON
     """
     try:
-        path = Path(filepath)
-        
-        if not path.exists():
-            logger.warning(f"File not found: {filepath}. Returning empty list.")
-            return []
+        if hasattr(filepath, 'read'):
+            raw = filepath.read()
+        else:
+            # Opening directly saves a stat() call on the common path
+            try:
+                raw = Path(filepath).read_bytes()
+            except (FileNotFoundError, NotADirectoryError):
+                logger.warning(f"File not found: {filepath}. Returning empty list.")
+                return []
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _loads(raw)
         
         logger.info(f"Successfully loaded {len(data)} records from {filepath}")
         return data
@@ -44,24 +109,44 @@ def load_data(filepath: str) -> List[Dict]:
         raise
 
 
-def save_data(filepath: str, data: List[Dict]) -> None:
+def save_data(filepath: Union[str, BinaryIO], data: List[Dict]) -> None:
     """Save data to JSON file.
     
     Args:
-        filepath: Path to save JSON file
+        filepath: Path to save JSON file, or an open binary file object to write to
         data: List of dictionaries to save
         
     Raises:
         IOError: If file cannot be written
     """
     try:
-        path = Path(filepath)
-        
-        # Create directory if it doesn't exist
-        path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if hasattr(filepath, 'write'):
+            filepath.write(dumps_json(data))
+        else:
+            path = Path(filepath)
+            
+            # Create directory if it doesn't exist
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Write a uniquely named sibling temp file and rename it over the
+            # target, so a crash mid-write never leaves a truncated data file
+            # behind and concurrent saves of the same file don't collide
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+            try:
+                with open(fd, 'wb') as f:
+                    # mkstemp creates the file as 0o600; keep the mode the data file would have had
+                    try:
+                        mode = stat.S_IMODE(os.stat(path).st_mode)
+                    except FileNotFoundError:
+                        mode = 0o666 & ~_UMASK
+                    os.chmod(tmp_name, mode)
+                    f.write(dumps_json(data))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_name, path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
         
         logger.info(f"Successfully saved {len(data)} records to {filepath}")
     
@@ -85,15 +170,15 @@ def backup_data(filepath: str) -> str:
     try:
         path = Path(filepath)
         
-        if not path.exists():
-            raise FileNotFoundError(f"Cannot backup non-existent file: {filepath}")
-        
         # Create backup filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = path.parent / f"{path.stem}_backup_{timestamp}{path.suffix}"
         
-        # Copy file to backup location
-        shutil.copy2(path, backup_path)
+        # Copy file to backup location; a missing source fails on open
+        try:
+            shutil.copy2(path, backup_path)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"Cannot backup non-existent file: {filepath}") from e
         
         logger.info(f"Created backup: {backup_path}")
         return str(backup_path)
@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from geopy.geocoders import Nominatim
 
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError, GeocoderUnavailable, GeocoderQuotaExceeded
@@ -232,3 +232,33 @@ def geocode_address(
             return None
     
     return None
+
+
+def geocode_addresses(
+    addresses: List[str],
+    timeout: int = 10,
+    max_retries: int = 3
+) -> List[Optional[Tuple[float, float]]]:
+    """Convert many addresses to coordinates, querying each distinct address once.
+    
+    Addresses that differ only in case or whitespace share one lookup. Requests
+    stay sequential because Nominatim's 1 request per second policy caps
+    throughput whatever the concurrency.
+    
+    Args:
+        addresses: Address strings to geocode
+        timeout: Request timeout in seconds (default: 10)
+        max_retries: Maximum number of retry attempts per address (default: 3)
+        
+    Returns:
+        List[Optional[Tuple[float, float]]]: (latitude, longitude) or None for
+        each address, in input order
+    """
+    results = {}
+    coords = []
+    for address in addresses:
+        key = ' '.join(address.split()).casefold() if isinstance(address, str) else address
+        if key not in results:
+            results[key] = geocode_address(address, timeout=timeout, max_retries=max_retries)
+        coords.append(results[key])
+    return coords
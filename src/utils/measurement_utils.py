@@ -5,10 +5,16 @@ from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Parallel TCP streams per transfer phase; a single flow rarely saturates the link
+SPEEDTEST_THREADS = 8
 
-def measure_speed() -> Optional[Dict]:
+
+def measure_speed(threads: int = SPEEDTEST_THREADS) -> Optional[Dict]:
     """Measure network speed using speedtest-cli.
     
+    Args:
+        threads: Number of parallel connections for download and upload
+    
     Returns:
         Optional[Dict]: Dictionary with download, upload, latency, and stability
                        Returns None if measurement fails
@@ -27,11 +33,11 @@ def measure_speed() -> Optional[Dict]:
         
         # Measure download speed
         logger.debug("Measuring download speed...")
-        download = st.download() / 1_000_000  # Convert to Mbps
+        download = st.download(threads=threads) / 1_000_000  # Convert to Mbps
         
         # Measure upload speed
         logger.debug("Measuring upload speed...")
-        upload = st.upload() / 1_000_000  # Convert to Mbps
+        upload = st.upload(threads=threads) / 1_000_000  # Convert to Mbps
         
         # Get ping/latency
         results = st.results.dict()
@@ -1,15 +1,68 @@
 """Machine Learning utilities for connectivity analysis and predictions."""
 
 import logging
-from typing import List, Dict
+from typing import List, Dict, Tuple, Union
 import numpy as np
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
-import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from ..models import PointArray
 
 logger = logging.getLogger(__name__)
 
 
+# Major Brazilian cities (lat, lon): São Paulo, Rio de Janeiro, Brasília, Salvador, Fortaleza
+MAJOR_CITIES = [
+    (-23.5505, -46.6333),  # São Paulo
+    (-22.9068, -43.1729),  # Rio de Janeiro
+    (-15.7939, -47.8828),  # Brasília
+    (-12.9714, -38.5014),  # Salvador
+    (-3.7172, -38.5434),   # Fortaleza
+]
+
+# City coordinates precomputed once at import time and shared read-only
+CITY_COORDS = np.array(MAJOR_CITIES, dtype=np.float64)
+CITY_LAT_RAD = np.deg2rad(CITY_COORDS[:, 0])
+CITY_LON_RAD = np.deg2rad(CITY_COORDS[:, 1])
+COS_CITY_LAT = np.cos(CITY_LAT_RAD)
+for _city_array in (CITY_COORDS, CITY_LAT_RAD, CITY_LON_RAD, COS_CITY_LAT):
+    _city_array.setflags(write=False)
+
+EARTH_RADIUS_KM = 6371.0
+
+# Points farther than this from every major city are considered rural
+RURAL_THRESHOLD_KM = 100.0
+
+
+def calculate_distance_from_major_city_batch(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Calculate distance from nearest major Brazilian city for many points at once.
+    
+    Evaluates the haversine formula against every major city in a single
+    broadcast expression of shape (points, cities) and keeps the per-point minimum.
+    
+    Args:
+        latitudes: Array of point latitudes
+        longitudes: Array of point longitudes
+        
+    Returns:
+        np.ndarray: Distance in kilometers to nearest major city for each point
+    """
+    lat_r = np.deg2rad(np.asarray(latitudes, dtype=np.float64))[:, None]
+    lon_r = np.deg2rad(np.asarray(longitudes, dtype=np.float64))[:, None]
+    
+    dlat = CITY_LAT_RAD[None, :] - lat_r
+    dlon = CITY_LON_RAD[None, :] - lon_r
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat_r) * COS_CITY_LAT[None, :] * np.sin(dlon / 2) ** 2
+    distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+    
+    return np.round(distances.min(axis=1), 2)
+
+
 def calculate_distance_from_major_city(latitude: float, longitude: float) -> float:
     """Calculate approximate distance from nearest major Brazilian city.
     
@@ -22,35 +75,10 @@ def calculate_distance_from_major_city(latitude: float, longitude: float) -> flo
     Returns:
         float: Approximate distance in kilometers to nearest major city
     """
-    # Major Brazilian cities (lat, lon)
-    major_cities = [
-        (-23.5505, -46.6333),  # São Paulo
-        (-22.9068, -43.1729),  # Rio de Janeiro
-        (-15.7939, -47.8828),  # Brasília
-        (-12.9714, -38.5014),  # Salvador
-        (-3.7172, -38.5434),   # Fortaleza
-    ]
-    
-    min_distance = float('inf')
-    
-    for city_lat, city_lon in major_cities:
-        # Haversine formula for great circle distance
-        dlat = math.radians(city_lat - latitude)
-        dlon = math.radians(city_lon - longitude)
-        
-        a = (math.sin(dlat / 2) ** 2 + 
-             math.cos(math.radians(latitude)) * math.cos(math.radians(city_lat)) * 
-             math.sin(dlon / 2) ** 2)
-        c = 2 * math.asin(math.sqrt(a))
-        
-        # Earth radius in km
-        distance = 6371 * c
-        min_distance = min(min_distance, distance)
-    
-    return round(min_distance, 2)
+    return float(calculate_distance_from_major_city_batch([latitude], [longitude])[0])
 
 
-def extract_geospatial_features(data: List[Dict]) -> np.ndarray:
+def extract_geospatial_features(data: Union[List[Dict], PointArray]) -> np.ndarray:
     """Extract geospatial features for ML models.
     
     Features include:
@@ -63,37 +91,142 @@ def extract_geospatial_features(data: List[Dict]) -> np.ndarray:
     - Latency
     
     Args:
-        data: List of connectivity point dictionaries
+        data: List of connectivity point dictionaries or a PointArray
         
     Returns:
         np.ndarray: Feature matrix for ML models
     """
     logger.info(f"Extracting geospatial features from {len(data)} points...")
     
-    features = []
+    points = data if isinstance(data, PointArray) else PointArray.from_dicts(data)
     
-    for point in data:
-        lat = point.get('latitude', 0)
-        lon = point.get('longitude', 0)
-        
-        distance_from_city = calculate_distance_from_major_city(lat, lon)
-        
-        quality_score = point.get('quality_score', {}).get('overall_score', 0)
-        speed_test = point.get('speed_test', {})
+    # Distances for all points in one vectorized call
+    distances = calculate_distance_from_major_city_batch(points.latitude, points.longitude)
+    
+    return np.column_stack((
+        points.latitude,
+        points.longitude,
+        distances,
+        points.quality_score,
+        points.download,
+        points.upload,
+        points.latency
+    ))
+
+
+def _score_batch(quality: np.ndarray, distance: np.ndarray, out_potential: np.ndarray) -> None:
+    """Compute improvement potential for each point into a preallocated array.
+    
+    Rural areas (far from cities) with poor connectivity have high potential.
+    
+    Args:
+        quality: Current overall quality score per point
+        distance: Distance from nearest major city in km per point
+        out_potential: Output array receiving the improvement potential per point
+    """
+    for i in range(quality.shape[0]):
+        rural_factor = min(distance[i] / 100.0, 2.0)  # Cap at 2x
+        quality_gap = max(100.0 - quality[i], 0.0)
+        out_potential[i] = quality_gap * (1.0 + rural_factor * 0.5)
+
+
+if NUMBA_AVAILABLE:
+    # Compiled on first call rather than at import; plain serial loop with IEEE semantics
+    score_batch = njit(cache=True)(_score_batch)
+else:
+    def score_batch(quality: np.ndarray, distance: np.ndarray, out_potential: np.ndarray) -> None:
+        """NumPy fallback for the improvement potential kernel when Numba is not installed."""
+        rural_factor = np.minimum(distance / 100.0, 2.0)
+        quality_gap = np.maximum(100.0 - quality, 0.0)
+        np.multiply(quality_gap, 1.0 + rural_factor * 0.5, out=out_potential)
+
+
+def _score_points(points: PointArray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Score every point for improvement potential and priority.
+    
+    Args:
+        points: Connectivity points in column-oriented form
         
-        feature_vector = [
-            lat,
-            lon,
-            distance_from_city,
-            quality_score,
-            speed_test.get('download', 0),
-            speed_test.get('upload', 0),
-            speed_test.get('latency', 0),
-        ]
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Distance from major city (km),
+            improvement potential and priority score for each point
+    """
+    distances = calculate_distance_from_major_city_batch(points.latitude, points.longitude)
+    
+    # Calculate improvement potential score (inverse of current quality, distance weighted)
+    # Higher score = more potential for improvement
+    improvement_scores = np.empty(len(points))
+    score_batch(
+        np.ascontiguousarray(points.quality_score, dtype=np.float64),
+        np.ascontiguousarray(distances, dtype=np.float64),
+        improvement_scores
+    )
+    
+    if len(points) < 3:
+        logger.warning("Insufficient data for ML predictions (minimum 3 points required)")
+        # Still provide basic enrichment for consistency
+        priorities = np.maximum(improvement_scores, 0)
+    else:
+        max_score = improvement_scores.max()
+        if max_score > 0:
+            priorities = improvement_scores / max_score * 100
+        else:
+            priorities = np.zeros_like(improvement_scores)
+    
+    return distances, improvement_scores, priorities
+
+
+ML_ANALYSIS_DTYPE = np.dtype([
+    ('improvement_potential', np.float64),
+    ('distance_from_city_km', np.float64),
+    ('is_rural', np.bool_),
+    ('priority_score', np.float64),
+])
+
+
+def predict_improvement_potential_arrays(points: PointArray) -> np.ndarray:
+    """Predict improvement potential for each point as a structured array.
+    
+    Column-oriented counterpart of predict_improvement_potential that skips
+    building a per-point dictionary.
+    
+    Args:
+        points: Connectivity points in column-oriented form
         
-        features.append(feature_vector)
+    Returns:
+        np.ndarray: Structured array of dtype ML_ANALYSIS_DTYPE, one row per point
+    """
+    distances, improvement_scores, priorities = _score_points(points)
     
-    return np.array(features)
+    result = np.empty(len(points), dtype=ML_ANALYSIS_DTYPE)
+    result['improvement_potential'] = improvement_scores
+    result['distance_from_city_km'] = distances
+    result['is_rural'] = distances > RURAL_THRESHOLD_KM
+    result['priority_score'] = priorities
+    return result
+
+
+def _attach_ml_analysis(data: List[Dict], analysis: np.ndarray) -> List[Dict]:
+    """Copy each point and add its row of the ML analysis as a dictionary.
+    
+    Args:
+        data: List of connectivity point dictionaries
+        analysis: Structured array from predict_improvement_potential_arrays
+        
+    Returns:
+        List[Dict]: Data enriched with an 'ml_analysis' dictionary per point
+    """
+    enriched_data = []
+    for point, (potential, distance, is_rural, priority) in zip(data, analysis.tolist(), strict=True):
+        enriched_point = point.copy()
+        enriched_point['ml_analysis'] = {
+            'improvement_potential': round(potential, 2),
+            'distance_from_city_km': round(distance, 2),
+            'is_rural': is_rural,
+            'priority_score': round(priority, 2)
+        }
+        enriched_data.append(enriched_point)
+    return enriched_data
 
 
 def predict_improvement_potential(data: List[Dict]) -> List[Dict]:
@@ -113,64 +246,8 @@ def predict_improvement_potential(data: List[Dict]) -> List[Dict]:
     try:
         logger.info("Predicting improvement potential with ML...")
         
-        if len(data) < 3:
-            logger.warning("Insufficient data for ML predictions (minimum 3 points required)")
-            # Still provide basic enrichment for consistency
-            enriched_data = []
-            for point in data:
-                enriched_point = point.copy()
-                distance = calculate_distance_from_major_city(
-                    point.get('latitude', 0), 
-                    point.get('longitude', 0)
-                )
-                current_score = point.get('quality_score', {}).get('overall_score', 0)
-                quality_gap = max(100 - current_score, 0)
-                rural_factor = min(distance / 100, 2.0)
-                potential = quality_gap * (1 + rural_factor * 0.5)
-                
-                enriched_point['ml_analysis'] = {
-                    'improvement_potential': round(potential, 2),
-                    'distance_from_city_km': round(distance, 2),
-                    'is_rural': bool(distance > 100),
-                    'priority_score': round(potential, 2) if potential > 0 else 0
-                }
-                enriched_data.append(enriched_point)
-            return enriched_data
-        
-        # Extract features
-        X = extract_geospatial_features(data)
-        
-        # Normalize features
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
-        # Calculate improvement potential score (inverse of current quality, distance weighted)
-        # Higher score = more potential for improvement
-        improvement_scores = []
-        for i, point in enumerate(data):
-            current_score = point.get('quality_score', {}).get('overall_score', 0)
-            distance = X[i, 2]  # Distance from major city
-            
-            # Rural areas (far from cities) with poor connectivity have high potential
-            rural_factor = min(distance / 100, 2.0)  # Cap at 2x
-            quality_gap = max(100 - current_score, 0)
-            
-            potential = quality_gap * (1 + rural_factor * 0.5)
-            improvement_scores.append(potential)
-        
-        # Add predictions to data
-        enriched_data = []
-        max_score = max(improvement_scores) if improvement_scores else 1
-        for i, point in enumerate(data):
-            enriched_point = point.copy()
-            priority = (improvement_scores[i] / max_score * 100) if max_score > 0 else 0
-            enriched_point['ml_analysis'] = {
-                'improvement_potential': round(improvement_scores[i], 2),
-                'distance_from_city_km': round(X[i, 2], 2),
-                'is_rural': bool(X[i, 2] > 100),  # >100km = rural
-                'priority_score': round(priority, 2)
-            }
-            enriched_data.append(enriched_point)
+        analysis = predict_improvement_potential_arrays(PointArray.from_dicts(data))
+        enriched_data = _attach_ml_analysis(data, analysis)
         
         logger.info("ML predictions completed")
         return enriched_data
@@ -180,19 +257,22 @@ def predict_improvement_potential(data: List[Dict]) -> List[Dict]:
         raise
 
 
-def identify_expansion_zones(data: List[Dict], n_zones: int = 3) -> Dict:
+def identify_expansion_zones(data: Union[List[Dict], PointArray], n_zones: int = 3) -> Dict:
     """Identify optimal zones for Starlink expansion using clustering.
     
-    Uses K-means clustering to identify geographic zones that would benefit most
+    Uses mini-batch K-means clustering to identify geographic zones that would benefit most
     from Starlink expansion based on connectivity gaps and rural characteristics.
     
     Args:
-        data: List of connectivity point dictionaries
+        data: List of connectivity point dictionaries or a PointArray
         n_zones: Number of expansion zones to identify
         
     Returns:
         Dict: Analysis of expansion zones with recommendations
     """
+    # Imported lazily so that only clustering callers pay the sklearn import cost
+    from sklearn.cluster import MiniBatchKMeans
+    
     try:
         logger.info(f"Identifying {n_zones} optimal expansion zones...")
         
@@ -200,43 +280,55 @@ def identify_expansion_zones(data: List[Dict], n_zones: int = 3) -> Dict:
             logger.warning(f"Insufficient data for {n_zones} zones (have {len(data)} points)")
             n_zones = max(1, len(data))
         
-        # Extract geographic and quality features
-        features = []
-        for point in data:
-            lat = point.get('latitude', 0)
-            lon = point.get('longitude', 0)
-            quality = point.get('quality_score', {}).get('overall_score', 0)
-            distance = calculate_distance_from_major_city(lat, lon)
-            
-            # Weight by quality gap and rurality
-            quality_gap = 100 - quality
-            rural_weight = min(distance / 100, 2.0)
-            
-            features.append([lat, lon, quality_gap * rural_weight])
-        
-        X = np.array(features)
-        
-        # Apply K-means clustering
-        kmeans = KMeans(n_clusters=n_zones, random_state=42, n_init='auto')
-        clusters = kmeans.fit_predict(X)
+        # Extract geographic and quality features in one vectorized pass
+        X_all = extract_geospatial_features(data)
+        lats = X_all[:, 0]
+        lons = X_all[:, 1]
+        distances = X_all[:, 2]
+        qualities = X_all[:, 3]
+        
+        # Weight by quality gap and rurality
+        quality_gap = 100 - qualities
+        rural_weight = np.minimum(distances / 100, 2.0)
+        
+        # Standardize in place on float32 columns (zero-variance columns are left centered)
+        X_scaled = np.column_stack((lats, lons, quality_gap * rural_weight)).astype(np.float32)
+        mean = X_scaled.mean(axis=0, keepdims=True)
+        std = X_scaled.std(axis=0, keepdims=True)
+        std[std == 0] = 1
+        np.subtract(X_scaled, mean, out=X_scaled)
+        np.divide(X_scaled, std, out=X_scaled)
+        
+        # Apply mini-batch K-means clustering
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_zones,
+            batch_size=min(1024, len(X_scaled)),
+            n_init=3,
+            random_state=42
+        )
+        clusters = kmeans.fit(X_scaled).labels_
+        
+        # Per-zone aggregates in a single pass over the labels
+        point_counts = np.bincount(clusters, minlength=n_zones)
+        lat_sums = np.bincount(clusters, weights=lats, minlength=n_zones)
+        lon_sums = np.bincount(clusters, weights=lons, minlength=n_zones)
+        quality_sums = np.bincount(clusters, weights=qualities, minlength=n_zones)
+        distance_sums = np.bincount(clusters, weights=distances, minlength=n_zones)
         
         # Analyze each zone
         zones = {}
         for zone_id in range(n_zones):
-            zone_points = [data[i] for i, c in enumerate(clusters) if c == zone_id]
+            point_count = point_counts[zone_id]
             
-            if not zone_points:
+            if not point_count:
                 continue
             
             # Calculate zone statistics
-            avg_quality = np.mean([p.get('quality_score', {}).get('overall_score', 0) 
-                                   for p in zone_points])
-            avg_distance = np.mean([calculate_distance_from_major_city(
-                                    p.get('latitude', 0), p.get('longitude', 0)) 
-                                   for p in zone_points])
+            avg_quality = quality_sums[zone_id] / point_count
+            avg_distance = distance_sums[zone_id] / point_count
             
-            center_lat = kmeans.cluster_centers_[zone_id][0]
-            center_lon = kmeans.cluster_centers_[zone_id][1]
+            center_lat = lat_sums[zone_id] / point_count
+            center_lon = lon_sums[zone_id] / point_count
             
             # Calculate priority (higher for rural areas with poor connectivity)
             rural_factor = min(avg_distance / 100, 2.0)
@@ -248,10 +340,10 @@ def identify_expansion_zones(data: List[Dict], n_zones: int = 3) -> Dict:
                     'latitude': round(center_lat, 4),
                     'longitude': round(center_lon, 4)
                 },
-                'point_count': int(len(zone_points)),
+                'point_count': int(point_count),
                 'avg_quality_score': round(avg_quality, 2),
                 'avg_distance_from_city_km': round(avg_distance, 2),
-                'is_primarily_rural': bool(avg_distance > 100),
+                'is_primarily_rural': bool(avg_distance > RURAL_THRESHOLD_KM),
                 'priority_score': round(priority, 2),
                 'recommendation': _generate_zone_recommendation(avg_quality, avg_distance)
             }
@@ -285,7 +377,7 @@ def _generate_zone_recommendation(avg_quality: float, avg_distance: float) -> st
     Returns:
         str: Recommendation text
     """
-    is_rural = avg_distance > 100
+    is_rural = avg_distance > RURAL_THRESHOLD_KM
     
     if is_rural and avg_quality < 60:
         return "HIGH PRIORITY: Rural area with poor connectivity - ideal for Starlink expansion"
@@ -299,14 +391,14 @@ def _generate_zone_recommendation(avg_quality: float, avg_distance: float) -> st
         return "LOW PRIORITY: Urban area with good connectivity - maintain current service"
 
 
-def analyze_starlink_roi(data: List[Dict]) -> Dict:
+def analyze_starlink_roi(data: Union[List[Dict], PointArray]) -> Dict:
     """Analyze ROI for Starlink deployment using ML-enhanced metrics.
     
     Evaluates potential return on investment for Starlink expansion by analyzing
     connectivity gaps, rural population proxy, and improvement potential.
     
     Args:
-        data: List of connectivity point dictionaries
+        data: List of connectivity point dictionaries or a PointArray
         
     Returns:
         Dict: ROI analysis with recommendations
@@ -322,30 +414,24 @@ def analyze_starlink_roi(data: List[Dict]) -> Dict:
                 'recommendations': []
             }
         
-        # Enrich data with ML predictions
-        enriched_data = predict_improvement_potential(data)
+        # Score all points on contiguous columns instead of enriched dicts
+        points = data if isinstance(data, PointArray) else PointArray.from_dicts(data)
+        analysis = predict_improvement_potential_arrays(points)
         
         # Categorize points
-        rural_points = []
-        high_priority_points = []
-        total_improvement_potential = 0
-        
-        for point in enriched_data:
-            ml = point.get('ml_analysis', {})
-            
-            if ml.get('is_rural', False):
-                rural_points.append(point)
-            
-            if ml.get('priority_score', 0) > 70:
-                high_priority_points.append(point)
-            
-            total_improvement_potential += ml.get('improvement_potential', 0)
+        rural_count = int(analysis['is_rural'].sum())
+        # Totals and counts use the per-point values rounded to 2 decimals, as
+        # predict_improvement_potential reports them
+        priorities = np.round(analysis['priority_score'], 2)
+        improvement_potentials = np.round(analysis['improvement_potential'], 2)
+        high_priority_count = int((priorities > 70).sum())
+        # Summed left to right like the per-point loop it replaces
+        total_improvement_potential = sum(improvement_potentials.tolist())
         
-        # Calculate ROI metrics
-        avg_current_quality = np.mean([p.get('quality_score', {}).get('overall_score', 0) 
-                                       for p in data])
+        # Calculate ROI metrics (a NumPy scalar, so round() below rounds as NumPy does)
+        avg_current_quality = points.quality_score.mean()
         
-        rural_percentage = (len(rural_points) / len(data)) * 100 if data else 0
+        rural_percentage = rural_count / len(data) * 100
         
         # Generate recommendations
         recommendations = []
@@ -364,9 +450,9 @@ def analyze_starlink_roi(data: List[Dict]) -> Dict:
                 "HIGH OPPORTUNITY: Average quality below 60 - significant room for improvement"
             )
         
-        if len(high_priority_points) > len(data) * 0.3:
+        if high_priority_count > len(data) * 0.3:
             recommendations.append(
-                f"URGENT ACTION: {len(high_priority_points)} high-priority areas need immediate attention"
+                f"URGENT ACTION: {high_priority_count} high-priority areas need immediate attention"
             )
         
         if not recommendations:
@@ -376,9 +462,9 @@ def analyze_starlink_roi(data: List[Dict]) -> Dict:
         
         result = {
             'total_points': len(data),
-            'rural_points': len(rural_points),
+            'rural_points': rural_count,
             'rural_percentage': round(rural_percentage, 2),
-            'high_priority_points': len(high_priority_points),
+            'high_priority_points': high_priority_count,
             'avg_current_quality': round(avg_current_quality, 2),
             'total_improvement_potential': round(total_improvement_potential, 2),
             'avg_improvement_potential': round(total_improvement_potential / len(data), 2) if data else 0,
@@ -429,7 +515,8 @@ def generate_ml_report(data: List[Dict]) -> Dict:
             return empty_report
         
         # Get ML predictions for each point
-        enriched_data = predict_improvement_potential(data)
+        analysis = predict_improvement_potential_arrays(PointArray.from_dicts(data))
+        enriched_data = _attach_ml_analysis(data, analysis)
         
         # Identify expansion zones
         expansion_zones = identify_expansion_zones(enriched_data, n_zones=3)
@@ -437,22 +524,23 @@ def generate_ml_report(data: List[Dict]) -> Dict:
         # Analyze ROI
         roi_analysis = analyze_starlink_roi(enriched_data)
         
-        # Extract top priority points
-        sorted_points = sorted(enriched_data, 
-                              key=lambda x: x.get('ml_analysis', {}).get('priority_score', 0),
-                              reverse=True)
+        # Extract top 5 priority points; a stable sort keeps tied points in
+        # input order, as sorted(..., reverse=True) on the enriched points did
+        priority_scores = np.array([point['ml_analysis']['priority_score'] for point in enriched_data])
+        top_idx = np.argsort(-priority_scores, kind='stable')[:5]
         
         top_priorities = []
-        for point in sorted_points[:5]:  # Top 5
-            ml = point.get('ml_analysis', {})
+        for i in top_idx.tolist():
+            point = enriched_data[i]
+            ml = point['ml_analysis']
             top_priorities.append({
                 'provider': point.get('provider', 'Unknown'),
                 'latitude': point.get('latitude', 0),
                 'longitude': point.get('longitude', 0),
                 'current_quality': point.get('quality_score', {}).get('overall_score', 0),
-                'priority_score': ml.get('priority_score', 0),
-                'distance_from_city_km': ml.get('distance_from_city_km', 0),
-                'is_rural': ml.get('is_rural', False)
+                'priority_score': ml['priority_score'],
+                'distance_from_city_km': ml['distance_from_city_km'],
+                'is_rural': ml['is_rural']
             })
         
         report = {
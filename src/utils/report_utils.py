@@ -1,6 +1,5 @@
 """Report generation utilities for multi-format output."""
 
-import json
 import logging
 from typing import List, Dict
 from pathlib import Path
@@ -14,10 +13,17 @@ try:
 except ImportError:
     COLORAMA_AVAILABLE = False
 
+from .data_utils import dumps_json
 from .i18n_utils import get_translation, get_rating_translation
 
 logger = logging.getLogger(__name__)
 
+# CSV report columns: point fields, then the flattened speed test and quality score
+CSV_BASE_FIELDS = ('id', 'latitude', 'longitude', 'provider', 'timestamp')
+CSV_SPEED_TEST_FIELDS = ('download', 'upload', 'latency', 'jitter', 'packet_loss', 'obstruction', 'stability')
+CSV_QUALITY_SCORE_FIELDS = ('overall_score', 'speed_score', 'latency_score', 'stability_score', 'rating')
+CSV_SECTIONS = (('speed_test', CSV_SPEED_TEST_FIELDS), ('quality_score', CSV_QUALITY_SCORE_FIELDS))
+
 
 def generate_report(data: List[Dict], format: str, output_path: str = None, language: str = 'en') -> str:
     """Generate report in specified format.
@@ -57,8 +63,8 @@ def _generate_json_report(data: List[Dict], output_path: str = None) -> str:
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Encoded straight to UTF-8 bytes (by orjson when installed)
+        path.write_bytes(dumps_json(data))
         
         logger.info(f"JSON report generated: {path}")
         return str(path)
@@ -82,49 +88,33 @@ def _generate_csv_report(data: List[Dict], output_path: str = None) -> str:
                 f.write("")
             return str(path)
         
-        # Flatten nested dictionaries for CSV
-        flattened_data = []
-        for point in data:
-            flat = {
-                'id': point.get('id', ''),
-                'latitude': point.get('latitude', ''),
-                'longitude': point.get('longitude', ''),
-                'provider': point.get('provider', ''),
-                'timestamp': point.get('timestamp', ''),
-            }
-            
-            # Add speed test data
-            if 'speed_test' in point:
-                st = point['speed_test']
-                flat.update({
-                    'download': st.get('download', ''),
-                    'upload': st.get('upload', ''),
-                    'latency': st.get('latency', ''),
-                    'jitter': st.get('jitter', ''),
-                    'packet_loss': st.get('packet_loss', ''),
-                    'obstruction': st.get('obstruction', ''),
-                    'stability': st.get('stability', ''),
-                })
-            
-            # Add quality score data
-            if 'quality_score' in point:
-                qs = point['quality_score']
-                flat.update({
-                    'overall_score': qs.get('overall_score', ''),
-                    'speed_score': qs.get('speed_score', ''),
-                    'latency_score': qs.get('latency_score', ''),
-                    'stability_score': qs.get('stability_score', ''),
-                    'rating': qs.get('rating', ''),
-                })
-            
-            flattened_data.append(flat)
+        # A section's columns are included when any point has that section;
+        # points without it get blank cells
+        fieldnames = list(CSV_BASE_FIELDS)
+        sections = []
+        for section, fields in CSV_SECTIONS:
+            if any(section in point for point in data):
+                fieldnames.extend(fields)
+                sections.append((section, fields, [''] * len(fields)))
+        
+        def rows():
+            # Each point's values go straight into a list, without building a
+            # flat dict for DictWriter to reorder
+            for point in data:
+                row = [point.get(field, '') for field in CSV_BASE_FIELDS]
+                for section, fields, blank in sections:
+                    if section in point:
+                        values = point[section]
+                        row.extend([values.get(field, '') for field in fields])
+                    else:
+                        row.extend(blank)
+                yield row
         
         # Write CSV
         with open(path, 'w', encoding='utf-8', newline='') as f:
-            if flattened_data:
-                writer = csv.DictWriter(f, fieldnames=flattened_data[0].keys())
-                writer.writeheader()
-                writer.writerows(flattened_data)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows())
         
         logger.info(f"CSV report generated: {path}")
         return str(path)
@@ -258,32 +248,38 @@ def _generate_html_report(data: List[Dict], output_path: str = None, language: s
         html.append(f"<th>{get_translation('rating', language)}</th>")
         html.append("</tr>")
         
-        for point in data:
-            html.append("<tr>")
-            html.append(f"<td>{point.get('provider', 'N/A')}</td>")
-            html.append(f"<td>{point.get('latitude', 'N/A')}, {point.get('longitude', 'N/A')}</td>")
-            
-            st = point.get('speed_test', {})
-            html.append(f"<td>{st.get('download', 'N/A')}</td>")
-            html.append(f"<td>{st.get('upload', 'N/A')}</td>")
-            html.append(f"<td>{st.get('latency', 'N/A')}</td>")
-            
-            qs = point.get('quality_score', {})
-            html.append(f"<td>{qs.get('overall_score', 'N/A')}</td>")
-            
-            rating = qs.get('rating', 'N/A')
-            rating_class = rating.lower() if rating != 'N/A' else ''
-            translated_rating = get_rating_translation(rating, language) if rating != 'N/A' else 'N/A'
-            html.append(f"<td class='{rating_class}'>{translated_rating}</td>")
-            
-            html.append("</tr>")
-        
-        html.append("</table>")
-        html.append("</body>")
-        html.append("</html>")
+        # The rating cell only depends on the rating, so each one is translated once
+        rating_cells = {'N/A': "<td class=''>N/A</td>"}
         
+        # Rows are written as they are rendered, so the file never has to be
+        # held in memory as a whole; parts are still separated by line breaks
         with open(path, 'w', encoding='utf-8') as f:
             f.write("\n".join(html))
+            
+            for point in data:
+                st = point.get('speed_test', {})
+                qs = point.get('quality_score', {})
+                
+                rating = qs.get('rating', 'N/A')
+                rating_cell = rating_cells.get(rating)
+                if rating_cell is None:
+                    rating_cell = f"<td class='{rating.lower()}'>{get_rating_translation(rating, language)}</td>"
+                    rating_cells[rating] = rating_cell
+                
+                # One string per table row, with the same line breaks as the surrounding parts
+                f.write(
+                    "\n<tr>\n"
+                    f"<td>{point.get('provider', 'N/A')}</td>\n"
+                    f"<td>{point.get('latitude', 'N/A')}, {point.get('longitude', 'N/A')}</td>\n"
+                    f"<td>{st.get('download', 'N/A')}</td>\n"
+                    f"<td>{st.get('upload', 'N/A')}</td>\n"
+                    f"<td>{st.get('latency', 'N/A')}</td>\n"
+                    f"<td>{qs.get('overall_score', 'N/A')}</td>\n"
+                    f"{rating_cell}\n"
+                    "</tr>"
+                )
+            
+            f.write("\n</table>\n</body>\n</html>")
         
         logger.info(f"HTML report generated: {path}")
         return str(path)
@@ -8,6 +8,7 @@ automatic fallback to simulated data when the API is unavailable.
 import logging
 import random
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List
 
 logger = logging.getLogger(__name__)
@@ -177,9 +178,12 @@ def compare_with_competitors(latitude: float, longitude: float) -> Dict:
     try:
         logger.info(f"Comparing providers for location ({latitude}, {longitude})")
         
-        # Get Starlink data
-        starlink_perf = get_performance_metrics(latitude, longitude)
-        starlink_coverage = get_coverage_data(latitude, longitude)
+        # Get Starlink data; the two API calls are independent, so wait on both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            perf_future = executor.submit(get_performance_metrics, latitude, longitude)
+            coverage_future = executor.submit(get_coverage_data, latitude, longitude)
+            starlink_perf = perf_future.result()
+            starlink_coverage = coverage_future.result()
         
         # Simulate competitor data (in production, these might be real APIs)
         comparison = {
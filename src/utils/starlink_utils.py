@@ -6,8 +6,12 @@ for different locations.
 
 import logging
 import requests
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from types import MappingProxyType
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -21,36 +25,114 @@ STARLINK_ENDPOINTS = {
 }
 
 
-def check_starlink_availability(latitude: float, longitude: float) -> Dict:
-    """Check if Starlink service is available at given coordinates.
+# Coverage data for Brazil and LATAM countries, keyed by country code
+_COVERAGE_MAPS = MappingProxyType({
+    'BR': {
+        'country_code': 'BR',
+        'country_name': 'Brazil',
+        'service_status': 'active',
+        'launch_date': '2022-01-05',
+        'coverage_percentage': 98.5,
+        'total_satellites_overhead': 450,
+        'ground_stations': 12,
+        'active_users': 550000,
+        'regions': {
+            'Norte': {'coverage': 85.0, 'status': 'expanding'},
+            'Nordeste': {'coverage': 92.0, 'status': 'active'},
+            'Centro-Oeste': {'coverage': 99.0, 'status': 'active'},
+            'Sudeste': {'coverage': 99.5, 'status': 'active'},
+            'Sul': {'coverage': 99.0, 'status': 'active'}
+        }
+    },
+    'AR': {
+        'country_code': 'AR',
+        'country_name': 'Argentina',
+        'service_status': 'active',
+        'launch_date': '2022-03-15',
+        'coverage_percentage': 97.0,
+        'total_satellites_overhead': 380,
+        'ground_stations': 8,
+        'active_users': 320000
+    },
+    'CL': {
+        'country_code': 'CL',
+        'country_name': 'Chile',
+        'service_status': 'active',
+        'launch_date': '2022-02-10',
+        'coverage_percentage': 98.0,
+        'total_satellites_overhead': 350,
+        'ground_stations': 7,
+        'active_users': 280000
+    },
+    'CO': {
+        'country_code': 'CO',
+        'country_name': 'Colombia',
+        'service_status': 'active',
+        'launch_date': '2023-06-20',
+        'coverage_percentage': 90.0,
+        'total_satellites_overhead': 320,
+        'ground_stations': 5,
+        'active_users': 180000
+    },
+    'MX': {
+        'country_code': 'MX',
+        'country_name': 'Mexico',
+        'service_status': 'active',
+        'launch_date': '2022-11-30',
+        'coverage_percentage': 95.0,
+        'total_satellites_overhead': 400,
+        'ground_stations': 9,
+        'active_users': 450000
+    },
+    'PE': {
+        'country_code': 'PE',
+        'country_name': 'Peru',
+        'service_status': 'active',
+        'launch_date': '2023-08-15',
+        'coverage_percentage': 88.0,
+        'total_satellites_overhead': 280,
+        'ground_stations': 4,
+        'active_users': 120000
+    }
+})
+
+
+# Availability statuses, indexed by the codes from _availability_status_codes
+AVAILABILITY_STATUSES = ('available', 'waitlist', 'not_available')
+
+
+def _availability_status_codes(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Classify coordinates into AVAILABILITY_STATUSES codes.
     
     Args:
-        latitude: Latitude coordinate
-        longitude: Longitude coordinate
+        latitudes: Latitude coordinates
+        longitudes: Longitude coordinates
         
     Returns:
-        Dict: Availability status and service details
+        np.ndarray: Index into AVAILABILITY_STATUSES for each coordinate
     """
-    logger.info(f"Checking Starlink availability for ({latitude}, {longitude})")
-    
-    # Mock availability check based on latitude/longitude
-    # In production, this would call the actual Starlink API
-    
     # Starlink is generally available in most of Brazil as of 2026
     # Some remote areas may have waitlist or limited availability
+    waitlist = (latitudes < -15) & (longitudes < -50)  # Remote Amazon region
+    not_available = ~waitlist & (np.abs(latitudes) > 60)  # Extreme latitudes
+    return waitlist.astype(np.int8) + 2 * not_available.astype(np.int8)
+
+
+def _build_availability(latitude: float, longitude: float, service_status: str, checked_at: str) -> Dict:
+    """Build the availability record for one location.
     
-    is_available = True
-    service_status = "available"
-    
-    # Simulate some areas with limited availability
-    if latitude < -15 and longitude < -50:  # Remote Amazon region
-        is_available = False
-        service_status = "waitlist"
-    elif abs(latitude) > 60:  # Extreme latitudes
-        is_available = False
-        service_status = "not_available"
+    Args:
+        latitude: Latitude coordinate
+        longitude: Longitude coordinate
+        service_status: One of AVAILABILITY_STATUSES
+        checked_at: ISO timestamp of the check
+        
+    Returns:
+        Dict: Availability status and service details
+    """
+    is_available = service_status == 'available'
     
-    availability = {
+    return {
         'latitude': latitude,
         'longitude': longitude,
         'service_available': is_available,
@@ -63,9 +145,29 @@ def check_starlink_availability(latitude: float, longitude: float) -> Dict:
             'upload_mbps': '10-20' if is_available else 'N/A',
             'latency_ms': '20-40' if is_available else 'N/A'
         },
-        'service_plans': get_starlink_service_plans() if is_available else [],
-        'checked_at': datetime.now().isoformat()
+        'service_plans': list(get_starlink_service_plans()) if is_available else [],
+        'checked_at': checked_at
     }
+
+
+def check_starlink_availability(latitude: float, longitude: float) -> Dict:
+    """Check if Starlink service is available at given coordinates.
+    
+    Args:
+        latitude: Latitude coordinate
+        longitude: Longitude coordinate
+        
+    Returns:
+        Dict: Availability status and service details
+    """
+    logger.info(f"Checking Starlink availability for ({latitude}, {longitude})")
+    
+    # Mock availability check based on latitude/longitude
+    # In production, this would call the actual Starlink API
+    code = _availability_status_codes(np.asarray(latitude), np.asarray(longitude))
+    service_status = AVAILABILITY_STATUSES[int(code)]
+    
+    availability = _build_availability(latitude, longitude, service_status, datetime.now().isoformat())
     
     logger.info(f"Starlink availability: {service_status} at ({latitude}, {longitude})")
     return availability
@@ -74,6 +176,9 @@ def check_starlink_availability(latitude: float, longitude: float) -> Dict:
 def check_batch_availability(coordinates: List[Tuple[float, float]]) -> List[Dict]:
     """Check Starlink availability for multiple locations.
     
+    All coordinates are classified in one vectorized pass and share a single
+    check timestamp.
+    
     Args:
         coordinates: List of (latitude, longitude) tuples
         
@@ -82,18 +187,26 @@ def check_batch_availability(coordinates: List[Tuple[float, float]]) -> List[Dic
     """
     logger.info(f"Checking Starlink availability for {len(coordinates)} locations")
     
-    results = []
-    for lat, lon in coordinates:
-        availability = check_starlink_availability(lat, lon)
-        results.append(availability)
+    coords = np.array(coordinates, dtype=np.float64).reshape(-1, 2)
+    codes = _availability_status_codes(coords[:, 0], coords[:, 1])
+    checked_at = datetime.now().isoformat()
+    
+    results = [
+        _build_availability(lat, lon, AVAILABILITY_STATUSES[code], checked_at)
+        for (lat, lon), code in zip(coordinates, codes.tolist(), strict=True)
+    ]
     
     logger.info(f"Completed batch availability check for {len(results)} locations")
     return results
 
 
+@lru_cache(maxsize=None)
 def get_starlink_service_plans() -> List[Dict]:
     """Get available Starlink service plans.
     
+    The plans are built once and the same list is returned on every call,
+    so callers must treat it as read-only.
+    
     Returns:
         List[Dict]: Available service plans with pricing and features
     """
@@ -166,6 +279,10 @@ def get_starlink_service_plans() -> List[Dict]:
 def get_starlink_coverage_map(country: str = 'BR') -> Dict:
     """Get Starlink coverage information for a country.
     
+    Known countries are looked up in the module-level coverage table and
+    returned as a shallow copy; nested 'regions' data is shared and must
+    not be modified.
+    
     Args:
         country: Country code (default: 'BR' for Brazil)
         
@@ -174,82 +291,15 @@ def get_starlink_coverage_map(country: str = 'BR') -> Dict:
     """
     logger.info(f"Fetching Starlink coverage map for {country}")
     
-    # Coverage data for Brazil and LATAM countries
-    coverage_maps = {
-        'BR': {
-            'country_code': 'BR',
-            'country_name': 'Brazil',
-            'service_status': 'active',
-            'launch_date': '2022-01-05',
-            'coverage_percentage': 98.5,
-            'total_satellites_overhead': 450,
-            'ground_stations': 12,
-            'active_users': 550000,
-            'regions': {
-                'Norte': {'coverage': 85.0, 'status': 'expanding'},
-                'Nordeste': {'coverage': 92.0, 'status': 'active'},
-                'Centro-Oeste': {'coverage': 99.0, 'status': 'active'},
-                'Sudeste': {'coverage': 99.5, 'status': 'active'},
-                'Sul': {'coverage': 99.0, 'status': 'active'}
-            }
-        },
-        'AR': {
-            'country_code': 'AR',
-            'country_name': 'Argentina',
-            'service_status': 'active',
-            'launch_date': '2022-03-15',
-            'coverage_percentage': 97.0,
-            'total_satellites_overhead': 380,
-            'ground_stations': 8,
-            'active_users': 320000
-        },
-        'CL': {
-            'country_code': 'CL',
-            'country_name': 'Chile',
-            'service_status': 'active',
-            'launch_date': '2022-02-10',
-            'coverage_percentage': 98.0,
-            'total_satellites_overhead': 350,
-            'ground_stations': 7,
-            'active_users': 280000
-        },
-        'CO': {
-            'country_code': 'CO',
-            'country_name': 'Colombia',
-            'service_status': 'active',
-            'launch_date': '2023-06-20',
-            'coverage_percentage': 90.0,
-            'total_satellites_overhead': 320,
-            'ground_stations': 5,
-            'active_users': 180000
-        },
-        'MX': {
-            'country_code': 'MX',
-            'country_name': 'Mexico',
-            'service_status': 'active',
-            'launch_date': '2022-11-30',
-            'coverage_percentage': 95.0,
-            'total_satellites_overhead': 400,
-            'ground_stations': 9,
-            'active_users': 450000
-        },
-        'PE': {
-            'country_code': 'PE',
-            'country_name': 'Peru',
-            'service_status': 'active',
-            'launch_date': '2023-08-15',
-            'coverage_percentage': 88.0,
-            'total_satellites_overhead': 280,
-            'ground_stations': 4,
-            'active_users': 120000
+    code = country.upper()
+    if code in _COVERAGE_MAPS:
+        coverage = dict(_COVERAGE_MAPS[code])
+    else:
+        coverage = {
+            'country_code': code,
+            'service_status': 'unknown',
+            'coverage_percentage': 0.0
         }
-    }
-    
-    coverage = coverage_maps.get(country.upper(), {
-        'country_code': country.upper(),
-        'service_status': 'unknown',
-        'coverage_percentage': 0.0
-    })
     
     logger.info(f"Retrieved coverage map for {country}")
     return coverage
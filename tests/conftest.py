@@ -0,0 +1,17 @@
+"""Shared pytest configuration for the test suite."""
+
+import pytest
+
+
+def pytest_configure(config):
+    """Register the xdist_group marker so --strict-markers accepts it without pytest-xdist."""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): keep tests on one pytest-xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep the report file I/O tests together on one worker under ``pytest -n auto``."""
+    for item in items:
+        if 'test_report_utils' in item.nodeid:
+            item.add_marker(pytest.mark.xdist_group('io'))
@@ -14,9 +14,9 @@ from src.utils.analysis_utils import analyze_temporal_evolution, compare_provide
 
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
-    """Sample connectivity data for testing."""
+    """Sample connectivity data for testing (read-only, shared by the module)."""
     return [
         {
             'id': 'test-1',
@@ -60,9 +60,9 @@ def sample_data():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def satellite_test_data():
-    """Test data with multiple satellite providers."""
+    """Test data with multiple satellite providers (read-only, shared by the module)."""
     return [
         {
             'provider': 'Starlink Gen2',
@@ -1,10 +1,13 @@
 """Tests for data utilities."""
 
 import pytest
+import io
 import json
+import os
+import threading
 from pathlib import Path
 
-from src.utils.data_utils import load_data, save_data, backup_data
+from src.utils.data_utils import load_data, save_data, backup_data, dumps_json
 
 
 @pytest.fixture
@@ -93,3 +96,118 @@ def test_save_creates_directory(tmp_path, sample_data):
     # Verify data
     loaded_data = load_data(str(test_file))
     assert len(loaded_data) == 2
+
+
+def test_load_data_accepts_non_finite_numbers():
+    """Test loading files written by the json module with NaN values."""
+    buffer = io.BytesIO(json.dumps([{'id': 'test-1', 'latency': float('nan')}]).encode('utf-8'))
+    
+    data = load_data(buffer)
+    
+    assert data[0]['id'] == 'test-1'
+    assert data[0]['latency'] != data[0]['latency']  # NaN
+
+
+def test_save_data_round_trips_non_finite_numbers():
+    """Test that NaN and Infinity survive a save and load unchanged."""
+    buffer = io.BytesIO()
+    save_data(buffer, [{'id': 'test-1', 'latency': float('nan'), 'download': float('inf'), 'upload': None}])
+    
+    buffer.seek(0)
+    data = load_data(buffer)
+    
+    assert data[0]['latency'] != data[0]['latency']  # NaN
+    assert data[0]['download'] == float('inf')
+    assert data[0]['upload'] is None
+
+
+def test_dumps_json_matches_json_module_layout():
+    """Test that the orjson encoder writes the same layout as the json module."""
+    pytest.importorskip('orjson')
+    data = [
+        {'timestamp': '2026-01-15T10:30:00', 'latitude': -23.5505, 'download': 85.2, 'city': 'São Paulo'},
+        {'timestamp': '2026-01-16T08:00:00', 'latitude': 0.0, 'download': 120.0}
+    ]
+    
+    assert dumps_json(data) == json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    assert dumps_json([]) == b'[]'
+
+
+def test_dumps_json_non_finite_numbers_nested():
+    """Test that NaN nested inside lists and dicts is written as NaN, not null."""
+    data = [{'id': 'test-1', 'history': [{'latency': float('nan')}, {'latency': 20.0}]}]
+    
+    assert dumps_json(data) == json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def test_dumps_json_nulls_stay_on_orjson():
+    """Test that data with real nulls is still encoded by orjson."""
+    orjson = pytest.importorskip('orjson')
+    data = [{'id': 'null', 'latency': None, 'download': 1e16, 'upload': 0.00001}]
+    
+    raw = dumps_json(data)
+    
+    assert raw == orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    assert json.loads(raw) == data
+
+
+def test_save_data_round_trips_unicode():
+    """Test that non-ASCII text is written as UTF-8 and read back unchanged."""
+    buffer = io.BytesIO()
+    data = [{'id': 'test-1', 'city': 'São Paulo', 'notes': ['Brasília', 'Goiânia']}]
+    
+    save_data(buffer, data)
+    
+    assert 'São Paulo'.encode('utf-8') in buffer.getvalue()
+    buffer.seek(0)
+    assert load_data(buffer) == data
+
+
+def test_save_data_failure_keeps_existing_file(tmp_path, sample_data):
+    """Test that a failed save leaves the previous file intact and no temp file."""
+    test_file = tmp_path / "test_data.json"
+    save_data(str(test_file), sample_data)
+    
+    with pytest.raises(TypeError):
+        save_data(str(test_file), [{'id': 'bad', 'value': object()}])
+    
+    assert load_data(str(test_file)) == sample_data
+    assert list(tmp_path.iterdir()) == [test_file]
+
+
+def test_save_data_concurrent_saves(tmp_path, sample_data):
+    """Test that overlapping saves of the same file all succeed."""
+    test_file = tmp_path / "test_data.json"
+    errors = []
+    
+    def save_repeatedly():
+        for _ in range(30):
+            try:
+                save_data(str(test_file), sample_data)
+            except Exception as e:
+                errors.append(e)
+    
+    threads = [threading.Thread(target=save_repeatedly) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    assert load_data(str(test_file)) == sample_data
+    assert list(tmp_path.iterdir()) == [test_file]
+
+
+@pytest.mark.skipif(os.name != 'posix', reason="POSIX file modes")
+def test_save_data_keeps_file_mode(tmp_path, sample_data):
+    """Test that saving creates files with the usual mode and keeps an existing file's mode."""
+    test_file = tmp_path / "test_data.json"
+    umask = os.umask(0)
+    os.umask(umask)
+    
+    save_data(str(test_file), sample_data)
+    assert test_file.stat().st_mode & 0o777 == 0o666 & ~umask
+    
+    test_file.chmod(0o640)
+    save_data(str(test_file), sample_data)
+    assert test_file.stat().st_mode & 0o777 == 0o640
@@ -3,8 +3,6 @@
 import json
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
 
 from src.utils.export_utils import (
     export_for_hybrid_simulator,
@@ -15,9 +13,9 @@ from src.utils.export_utils import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_data():
-    """Create sample connectivity data for testing."""
+    """Create sample connectivity data for testing (read-only, shared by the module)."""
     return [
         {
             'id': 'test-1',
@@ -88,28 +86,46 @@ def sample_data():
     ]
 
 
-@pytest.fixture
-def temp_output_dir():
-    """Create a temporary directory for test outputs."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+@pytest.fixture(scope="module")
+def temp_output_dir(tmp_path_factory):
+    """Single temporary directory shared by all export files in this module."""
+    return str(tmp_path_factory.mktemp('exports'))
 
 
-def test_export_for_hybrid_simulator(sample_data, temp_output_dir):
-    """Test export for Hybrid Architecture Simulator."""
+@pytest.fixture(scope="module")
+def hybrid_export(sample_data, temp_output_dir):
+    """Export sample_data for the Hybrid Architecture Simulator once per module.
+
+    Returns:
+        Tuple of (output_path, result, parsed_contents)
+    """
     output_path = str(Path(temp_output_dir) / 'hybrid_test.json')
-    
     result = export_for_hybrid_simulator(sample_data, output_path)
+    with open(result, 'r') as f:
+        return output_path, result, json.load(f)
+
+
+@pytest.fixture(scope="module")
+def agrix_export(sample_data, temp_output_dir):
+    """Export sample_data for AgriX-Boost once per module.
+
+    Returns:
+        Tuple of (output_path, result, parsed_contents)
+    """
+    output_path = str(Path(temp_output_dir) / 'agrix_test.json')
+    result = export_for_agrix_boost(sample_data, output_path)
+    with open(result, 'r') as f:
+        return output_path, result, json.load(f)
+
+
+def test_export_for_hybrid_simulator(hybrid_export):
+    """Test export for Hybrid Architecture Simulator."""
+    output_path, result, data = hybrid_export
     
     # Verify file was created
     assert Path(result).exists()
     assert result == output_path
     
-    # Load and verify content
-    with open(result, 'r') as f:
-        data = json.load(f)
-    
     # Check metadata
     assert 'metadata' in data
     assert data['metadata']['source'] == 'Rural Connectivity Mapper 2026'
@@ -146,20 +162,14 @@ def test_export_for_hybrid_simulator(sample_data, temp_output_dir):
     assert point['failover_indicators']['recommended_primary'] is True
 
 
-def test_export_for_agrix_boost(sample_data, temp_output_dir):
+def test_export_for_agrix_boost(agrix_export):
     """Test export for AgriX-Boost."""
-    output_path = str(Path(temp_output_dir) / 'agrix_test.json')
-    
-    result = export_for_agrix_boost(sample_data, output_path)
+    output_path, result, data = agrix_export
     
     # Verify file was created
     assert Path(result).exists()
     assert result == output_path
     
-    # Load and verify content
-    with open(result, 'r') as f:
-        data = json.load(f)
-    
     # Check metadata
     assert 'metadata' in data
     assert data['metadata']['source'] == 'Rural Connectivity Mapper 2026'
@@ -312,14 +322,9 @@ def test_export_empty_data(temp_output_dir):
     assert len(data['connectivity_points']) == 0
 
 
-def test_failover_indicators_thresholds(sample_data, temp_output_dir):
+def test_failover_indicators_thresholds(hybrid_export):
     """Test that failover indicators use correct thresholds."""
-    output_path = str(Path(temp_output_dir) / 'failover_test.json')
-    
-    result = export_for_hybrid_simulator(sample_data, output_path)
-    
-    with open(result, 'r') as f:
-        data = json.load(f)
+    data = hybrid_export[2]
     
     # Check Fair quality point (index 2)
     fair_point = data['connectivity_points'][2]
@@ -334,14 +339,9 @@ def test_failover_indicators_thresholds(sample_data, temp_output_dir):
     assert fair_point['failover_indicators']['stable_connection'] is False
 
 
-def test_farm_suitability_thresholds(sample_data, temp_output_dir):
+def test_farm_suitability_thresholds(agrix_export):
     """Test that farm suitability indicators use correct thresholds."""
-    output_path = str(Path(temp_output_dir) / 'suitability_test.json')
-    
-    result = export_for_agrix_boost(sample_data, output_path)
-    
-    with open(result, 'r') as f:
-        data = json.load(f)
+    data = agrix_export[2]
     
     # Check Fair quality point (index 2)
     fair_point = data['connectivity_layer'][2]
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch
 
-from src.utils.geocoding_utils import geocode_coordinates, geocode_address
+from src.utils.geocoding_utils import geocode_coordinates, geocode_address, geocode_addresses
 from geopy.exc import GeocoderTimedOut, GeocoderQuotaExceeded, GeocoderUnavailable
 
 
@@ -131,3 +131,18 @@ def test_geocoding_no_results():
         address = geocode_coordinates(-23.5505, -46.6333)
         
         assert address is None
+
+
+def test_geocoding_addresses_deduplicates():
+    """Test batch geocoding queries each distinct address once."""
+    with patch('src.utils.geocoding_utils.geolocator.geocode') as mock_geocode, \
+         patch('src.utils.geocoding_utils._wait_for_rate_limit'):
+        mock_location = Mock()
+        mock_location.latitude = -23.5505
+        mock_location.longitude = -46.6333
+        mock_geocode.return_value = mock_location
+        
+        coords = geocode_addresses(["São Paulo, Brazil", "  são paulo,  BRAZIL ", ""])
+        
+        assert coords == [(-23.5505, -46.6333), (-23.5505, -46.6333), None]
+        mock_geocode.assert_called_once()
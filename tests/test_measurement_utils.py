@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from src.utils.measurement_utils import measure_speed
+from src.utils.measurement_utils import measure_speed, SPEEDTEST_THREADS
 
 
 def test_measure_speed():
@@ -33,5 +33,5 @@ def test_measure_speed():
         
         # Verify speedtest was called
         mock_st.get_best_server.assert_called_once()
-        mock_st.download.assert_called_once()
-        mock_st.upload.assert_called_once()
+        mock_st.download.assert_called_once_with(threads=SPEEDTEST_THREADS)
+        mock_st.upload.assert_called_once_with(threads=SPEEDTEST_THREADS)
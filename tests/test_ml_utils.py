@@ -1,9 +1,14 @@
 """Tests for ML utilities."""
 
+import numpy as np
+
+from src.models import PointArray
 from src.utils.ml_utils import (
     calculate_distance_from_major_city,
+    calculate_distance_from_major_city_batch,
     extract_geospatial_features,
     predict_improvement_potential,
+    predict_improvement_potential_arrays,
     identify_expansion_zones,
     analyze_starlink_roi,
     generate_ml_report
@@ -43,6 +48,18 @@ def test_calculate_distance_from_major_city():
     assert distance_remote > 100  # Should be far from major cities
 
 
+def test_calculate_distance_from_major_city_batch():
+    """Test batched distance calculation matches the scalar version."""
+    lats = np.array([-23.5505, -10.0, -3.7172])
+    lons = np.array([-46.6333, -50.0, -38.5434])
+    
+    distances = calculate_distance_from_major_city_batch(lats, lons)
+    
+    assert distances.shape == (3,)
+    for lat, lon, distance in zip(lats, lons, distances, strict=True):
+        assert distance == calculate_distance_from_major_city(lat, lon)
+
+
 def test_extract_geospatial_features():
     """Test geospatial feature extraction."""
     data = [
@@ -85,6 +102,24 @@ def test_predict_improvement_potential():
     assert rural_poor['ml_analysis']['improvement_potential'] > 0
 
 
+def test_predict_improvement_potential_arrays():
+    """Test structured-array ML prediction matches the dict-based API."""
+    data = [
+        create_sample_point(-23.5505, -46.6333, 80, 100, 20, 30, "Starlink"),
+        create_sample_point(-10.0, -50.0, 40, 50, 8, 80, "HughesNet"),
+        create_sample_point(-15.7939, -47.8828, 90, 150, 25, 25, "Starlink")
+    ]
+    
+    analysis = predict_improvement_potential_arrays(PointArray.from_dicts(data))
+    enriched_data = predict_improvement_potential(data)
+    
+    assert analysis.shape == (3,)
+    assert analysis['is_rural'].tolist() == [p['ml_analysis']['is_rural'] for p in enriched_data]
+    for row, point in zip(analysis, enriched_data, strict=True):
+        assert round(float(row['priority_score']), 2) == point['ml_analysis']['priority_score']
+        assert round(float(row['improvement_potential']), 2) == point['ml_analysis']['improvement_potential']
+
+
 def test_predict_improvement_potential_insufficient_data():
     """Test ML prediction with insufficient data."""
     data = [create_sample_point(-23.5505, -46.6333, 80, 100, 20, 30, "Starlink")]
@@ -165,6 +200,44 @@ def test_analyze_starlink_roi():
     assert len(roi['recommendations']) > 0
 
 
+def test_analyze_starlink_roi_counts_rounded_priorities():
+    """Test that high-priority points are counted from the rounded per-point priorities."""
+    # Same location, so priorities are 100, 70.003 (reported as 70.0) and 50
+    data = [
+        create_sample_point(-10.0, -50.0, 0, 10, 2, 100),
+        create_sample_point(-10.0, -50.0, 29.997, 10, 2, 100),
+        create_sample_point(-10.0, -50.0, 50, 10, 2, 100)
+    ]
+    
+    roi = analyze_starlink_roi(data)
+    priorities = [p['ml_analysis']['priority_score'] for p in predict_improvement_potential(data)]
+    
+    assert priorities[1] == 70.0
+    assert roi['high_priority_points'] == sum(priority > 70 for priority in priorities) == 1
+
+
+def test_analyze_starlink_roi_totals_match_rounded_points():
+    """Test that ROI totals are built from the rounded per-point values."""
+    rng = np.random.default_rng(7)
+    data = [
+        create_sample_point(lat, lon, quality, 50, 10, 40)
+        for lat, lon, quality in zip(
+            rng.uniform(-30, 0, 500), rng.uniform(-70, -35, 500), rng.uniform(0, 100, 500), strict=True
+        )
+    ]
+    
+    roi = analyze_starlink_roi(data)
+    ml = [p['ml_analysis'] for p in predict_improvement_potential(data)]
+    total = 0
+    for analysis in ml:
+        total += analysis['improvement_potential']
+    
+    assert roi['total_improvement_potential'] == round(total, 2)
+    assert roi['avg_improvement_potential'] == round(total / len(data), 2)
+    assert roi['high_priority_points'] == sum(analysis['priority_score'] > 70 for analysis in ml)
+    assert roi['avg_current_quality'] == round(np.mean([p['quality_score']['overall_score'] for p in data]), 2)
+
+
 def test_analyze_starlink_roi_empty_data():
     """Test ROI analysis with empty data."""
     roi = analyze_starlink_roi([])
@@ -212,6 +285,19 @@ def test_generate_ml_report():
     assert all('ml_analysis' in point for point in report['enriched_data'])
 
 
+def test_generate_ml_report_top_priorities_keep_input_order_for_ties():
+    """Test that tied priorities keep input order, including at the top-5 cut."""
+    # Same location and quality, so all tied points share one priority score
+    tied = [create_sample_point(-10.0, -50.0, 40, 50, 8, 80, f"ISP {i}") for i in range(6)]
+    data = [create_sample_point(-10.0, -50.0, 90, 50, 8, 80, "Best")] + tied
+    data.insert(3, create_sample_point(-10.0, -50.0, 0, 50, 8, 80, "Worst quality"))
+    
+    report = generate_ml_report(data)
+    
+    providers = [area['provider'] for area in report['top_priority_areas']]
+    assert providers == ["Worst quality", "ISP 0", "ISP 1", "ISP 2", "ISP 3"]
+
+
 def test_rural_identification():
     """Test that rural areas are correctly identified."""
     # Urban area (near São Paulo)
@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime
 
-from src.models import SpeedTest, QualityScore, ConnectivityPoint
+from src.models import SpeedTest, QualityScore, ConnectivityPoint, PointArray
 
 
 def test_connectivity_point_creation():
@@ -215,3 +215,97 @@ def test_speed_test_obstruction_calculation():
     # High obstruction should significantly reduce stability
     assert speed_test_high_obstruction.stability < 50
 
+
+def test_quality_score_rating_thresholds():
+    """Test QualityScore rating boundaries."""
+    assert QualityScore(overall_score=39.9, speed_score=0, latency_score=0, stability_score=0).rating == "Poor"
+    assert QualityScore(overall_score=40.0, speed_score=0, latency_score=0, stability_score=0).rating == "Fair"
+    assert QualityScore(overall_score=60.0, speed_score=0, latency_score=0, stability_score=0).rating == "Good"
+    assert QualityScore(overall_score=80.0, speed_score=0, latency_score=0, stability_score=0).rating == "Excellent"
+
+
+def test_quality_score_calculate_batch():
+    """Test batched overall score calculation matches the per-object weighting."""
+    speed_tests = [
+        SpeedTest(download=200.0, upload=20.0, latency=20.0, jitter=1.0),
+        SpeedTest(download=20.0, upload=2.0, latency=150.0, jitter=25.0, packet_loss=5.0)
+    ]
+    scores = [QualityScore.calculate(st) for st in speed_tests]
+
+    overall = QualityScore.calculate_batch(
+        [s.speed_score for s in scores],
+        [s.latency_score for s in scores],
+        [s.stability_score for s in scores]
+    )
+
+    assert overall.shape == (2,)
+    for batch_score, score in zip(overall, scores, strict=True):
+        assert batch_score == pytest.approx(score.overall_score, abs=0.01)
+
+
+def test_point_array_from_dicts():
+    """Test PointArray column-oriented conversion."""
+    points = [
+        ConnectivityPoint(
+            latitude=-23.5505,
+            longitude=-46.6333,
+            provider='Starlink',
+            speed_test=SpeedTest(download=150.0, upload=18.0, latency=25.0, jitter=3.0)
+        ).to_dict(),
+        ConnectivityPoint(
+            latitude=-10.0,
+            longitude=-50.0,
+            provider='Viasat',
+            speed_test=SpeedTest(download=25.0, upload=3.0, latency=600.0, packet_loss=1.0)
+        ).to_dict(),
+        {'latitude': -12.0, 'longitude': -52.0, 'provider': 'Starlink'}
+    ]
+
+    array = PointArray.from_dicts(points)
+
+    assert len(array) == 3
+    assert array.latitude.tolist() == [-23.5505, -10.0, -12.0]
+    assert array.download.tolist() == [150.0, 25.0, 0.0]
+    assert array.jitter[0] == 3.0
+    assert array.quality_score[0] == points[0]['quality_score']['overall_score']
+    assert array.quality_score[2] == 0.0
+    assert array.providers == ['Starlink', 'Viasat']
+    assert array.provider_code.tolist() == [0, 1, 0]
+    assert array.provider_mask('Starlink').tolist() == [True, False, True]
+    assert not array.provider_mask('HughesNet').any()
+
+
+def test_point_array_provider_stats():
+    """Test per-provider reductions over PointArray columns."""
+    array = PointArray.from_dicts([
+        {'provider': 'Starlink', 'speed_test': {'download': 150.0, 'stability': 90.0}},
+        {'provider': 'Viasat', 'speed_test': {'download': 25.0}},
+        {'provider': 'Starlink', 'speed_test': {'download': 100.0, 'stability': 80.0}}
+    ])
+
+    stats = array.provider_stats(['download', 'stability'])
+
+    assert array.provider_counts().tolist() == [2, 1]
+    assert stats['download']['mean'].tolist() == [125.0, 25.0]
+    assert stats['download']['min'].tolist() == [100.0, 25.0]
+    assert stats['download']['max'].tolist() == [150.0, 25.0]
+    assert stats['stability']['mean'].tolist() == [85.0, 0.0]
+
+
+def test_quality_score_from_dict():
+    """Test QualityScore from_dict with full and partial data."""
+    restored = QualityScore.from_dict({
+        'overall_score': 72.5,
+        'speed_score': 80.0,
+        'latency_score': 60.0,
+        'stability_score': 75.0,
+        'rating': 'Excellent'
+    })
+
+    assert restored.overall_score == 72.5
+    assert restored.stability_score == 75.0
+    assert restored.rating == "Good"  # Recomputed from overall_score
+
+    partial = QualityScore.from_dict({'overall_score': 30.0})
+    assert partial.speed_score == 0.0
+    assert partial.rating == "Poor"
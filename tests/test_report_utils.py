@@ -1,17 +1,34 @@
 """Tests for report generation utilities."""
 
 import pytest
+import io
 import json
 import csv
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from src.utils.report_utils import generate_report
 
 
-@pytest.fixture
+def _encode(*needles):
+    return tuple(needle.encode('utf-8') for needle in needles)
+
+
+HTML_EN_NEEDLES = _encode('<!DOCTYPE html>', 'Starlink', 'Claro', 'Excellent')
+HTML_PT_NEEDLES = _encode('<!DOCTYPE html>', 'Provedor', 'Excelente', 'MAPEADOR DE CONECTIVIDADE RURAL')
+TXT_EN_NEEDLES = _encode('RURAL CONNECTIVITY MAPPER 2026', 'Starlink', 'Total Points: 2')
+TXT_PT_NEEDLES = _encode('MAPEADOR DE CONECTIVIDADE RURAL', 'Provedor', 'Total de Pontos: 2', 'Excelente')
+
+
+@pytest.fixture(scope="session")
 def sample_data():
-    """Sample connectivity data for testing."""
-    return [
+    """Sample connectivity data for testing (shared read-only across the session)."""
+    return (
         {
             'id': 'test-1',
             'latitude': -23.5505,
@@ -56,117 +73,131 @@ def sample_data():
                 'rating': 'Good'
             }
         }
-    ]
+    )
 
 
-def test_generate_json_report(sample_data, tmp_path):
-    """Test JSON report generation."""
-    output_path = tmp_path / "test_report.json"
-    
-    result_path = generate_report(sample_data, 'json', str(output_path))
+@pytest.fixture(scope="module")
+def reports_dir(tmp_path_factory):
+    """Single temporary directory shared by all report files in this module."""
+    return tmp_path_factory.mktemp('reports')
+
+
+@pytest.fixture(scope="module")
+def rendered_report(sample_data, reports_dir):
+    """Render each (format, language) report once per module and return its path."""
+    cache = {}
     
-    assert Path(result_path).exists()
+    def _get(fmt, language='en'):
+        key = (fmt, language)
+        if key not in cache:
+            output_path = reports_dir / f"test_report_{language}.{fmt}"
+            cache[key] = generate_report(list(sample_data), fmt, str(output_path), language=language)
+        return cache[key]
     
+    return _get
+
+
+@pytest.fixture(scope="module")
+def json_report(rendered_report):
+    """Parsed contents of the JSON report, loaded once per module."""
+    raw = Path(rendered_report('json')).read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def test_generate_json_report(json_report):
+    """Test JSON report generation."""
     # Verify JSON content
-    with open(result_path, 'r') as f:
-        data = json.load(f)
+    data = json_report
     
     assert len(data) == 2
     assert data[0]['id'] == 'test-1'
     assert data[1]['provider'] == 'Claro'
 
 
-def test_generate_csv_report(sample_data, tmp_path):
+def test_generate_csv_report(rendered_report):
     """Test CSV report generation."""
-    output_path = tmp_path / "test_report.csv"
-    
-    result_path = generate_report(sample_data, 'csv', str(output_path))
-    
-    assert Path(result_path).exists()
+    result_path = rendered_report('csv')
     
     # Verify CSV content
-    with open(result_path, 'r') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    header, *rows = csv.reader(io.StringIO(Path(result_path).read_text(encoding='utf-8')))
     
     assert len(rows) == 2
-    assert 'provider' in rows[0]
-    assert rows[0]['provider'] == 'Starlink'
-    assert 'overall_score' in rows[0]
+    assert 'provider' in header
+    assert rows[0][header.index('provider')] == 'Starlink'
+    assert 'overall_score' in header
 
 
-def test_generate_html_report(sample_data, tmp_path):
-    """Test HTML report generation."""
-    output_path = tmp_path / "test_report.html"
+def test_generate_csv_report_mixed_sections(tmp_path):
+    """Test that points with sections the first point lacks are still written."""
+    data = [
+        {'id': 'test-1', 'provider': 'Starlink'},
+        {'id': 'test-2', 'provider': 'Claro', 'speed_test': {'download': 92.1}},
+        {'id': 'test-3', 'provider': 'Vivo', 'quality_score': {'rating': 'Good'}}
+    ]
     
-    result_path = generate_report(sample_data, 'html', str(output_path))
+    result_path = generate_report(data, 'csv', str(tmp_path / 'mixed.csv'))
     
-    assert Path(result_path).exists()
+    rows = list(csv.DictReader(io.StringIO(Path(result_path).read_text(encoding='utf-8'))))
+    
+    assert [row['id'] for row in rows] == ['test-1', 'test-2', 'test-3']
+    assert [row['download'] for row in rows] == ['', '92.1', '']
+    assert [row['rating'] for row in rows] == ['', '', 'Good']
+
+
+def test_generate_html_report(rendered_report):
+    """Test HTML report generation."""
+    result_path = rendered_report('html')
     
     # Verify HTML content
-    with open(result_path, 'r') as f:
-        content = f.read()
+    content = Path(result_path).read_bytes()
     
-    assert '<!DOCTYPE html>' in content
-    assert 'Starlink' in content
-    assert 'Claro' in content
-    assert 'Excellent' in content
+    missing = [needle for needle in HTML_EN_NEEDLES if needle not in content]
+    assert not missing, missing
 
 
-def test_generate_html_report_portuguese(sample_data, tmp_path):
+def test_generate_html_report_portuguese(rendered_report):
     """Test HTML report generation in Portuguese."""
-    output_path = tmp_path / "test_report_pt.html"
-    
-    result_path = generate_report(sample_data, 'html', str(output_path), language='pt')
-    
-    assert Path(result_path).exists()
+    result_path = rendered_report('html', 'pt')
     
     # Verify Portuguese content
-    with open(result_path, 'r') as f:
-        content = f.read()
+    content = Path(result_path).read_bytes()
     
-    assert '<!DOCTYPE html>' in content
-    assert 'Provedor' in content
-    assert 'Excelente' in content
-    assert 'MAPEADOR DE CONECTIVIDADE RURAL' in content
+    missing = [needle for needle in HTML_PT_NEEDLES if needle not in content]
+    assert not missing, missing
 
 
-def test_generate_txt_report(sample_data, tmp_path):
+def test_generate_txt_report(rendered_report):
     """Test TXT report generation."""
-    output_path = tmp_path / "test_report.txt"
-    
-    result_path = generate_report(sample_data, 'txt', str(output_path))
-    
-    assert Path(result_path).exists()
+    result_path = rendered_report('txt')
     
     # Verify TXT content
-    with open(result_path, 'r') as f:
-        content = f.read()
+    content = Path(result_path).read_bytes()
     
-    assert 'RURAL CONNECTIVITY MAPPER 2026' in content
-    assert 'Starlink' in content
-    assert 'Total Points: 2' in content
+    missing = [needle for needle in TXT_EN_NEEDLES if needle not in content]
+    assert not missing, missing
 
 
-def test_generate_txt_report_portuguese(sample_data, tmp_path):
+def test_generate_txt_report_portuguese(rendered_report):
     """Test TXT report generation in Portuguese."""
-    output_path = tmp_path / "test_report_pt.txt"
-    
-    result_path = generate_report(sample_data, 'txt', str(output_path), language='pt')
-    
-    assert Path(result_path).exists()
+    result_path = rendered_report('txt', 'pt')
     
     # Verify Portuguese TXT content
-    with open(result_path, 'r') as f:
-        content = f.read()
+    content = Path(result_path).read_bytes()
     
-    assert 'MAPEADOR DE CONECTIVIDADE RURAL' in content
-    assert 'Provedor' in content
-    assert 'Total de Pontos: 2' in content
-    assert 'Excelente' in content
+    missing = [needle for needle in TXT_PT_NEEDLES if needle not in content]
+    assert not missing, missing
 
 
 def test_generate_report_invalid_format(sample_data):
     """Test error handling for invalid format."""
     with pytest.raises(ValueError):
         generate_report(sample_data, 'invalid_format')
+
+
+def test_generate_json_report_keeps_non_finite_numbers(tmp_path):
+    """Test that the JSON report writes NaN and Infinity like the json module."""
+    data = [{'id': 'test-1', 'speed_test': {'latency': float('nan'), 'download': float('inf')}}]
+    
+    result_path = generate_report(data, 'json', str(tmp_path / 'report.json'))
+    
+    assert Path(result_path).read_text(encoding='utf-8') == json.dumps(data, indent=2, ensure_ascii=False)
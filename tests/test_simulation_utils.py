@@ -1,41 +1,50 @@
 """Tests for simulation utilities."""
 
+import random
+from types import MappingProxyType
+
+import numpy as np
 import pytest
 
 from src.utils.simulation_utils import simulate_router_impact
 
 
-@pytest.fixture
+# Frozen at import time: simulate_router_impact copies what it changes, so every
+# test can share the same read-only points.
+SAMPLE_DATA = (
+    MappingProxyType({
+        'id': 'test-1',
+        'latitude': -23.5505,
+        'longitude': -46.6333,
+        'provider': 'Starlink',
+        'quality_score': MappingProxyType({
+            'overall_score': 70.0,
+            'speed_score': 75.0,
+            'latency_score': 65.0,
+            'stability_score': 70.0,
+            'rating': 'Good'
+        })
+    }),
+    MappingProxyType({
+        'id': 'test-2',
+        'latitude': -22.9068,
+        'longitude': -43.1729,
+        'provider': 'Claro',
+        'quality_score': MappingProxyType({
+            'overall_score': 50.0,
+            'speed_score': 55.0,
+            'latency_score': 45.0,
+            'stability_score': 50.0,
+            'rating': 'Fair'
+        })
+    })
+)
+
+
+@pytest.fixture(scope="session")
 def sample_data():
-    """Sample connectivity data for testing."""
-    return [
-        {
-            'id': 'test-1',
-            'latitude': -23.5505,
-            'longitude': -46.6333,
-            'provider': 'Starlink',
-            'quality_score': {
-                'overall_score': 70.0,
-                'speed_score': 75.0,
-                'latency_score': 65.0,
-                'stability_score': 70.0,
-                'rating': 'Good'
-            }
-        },
-        {
-            'id': 'test-2',
-            'latitude': -22.9068,
-            'longitude': -43.1729,
-            'provider': 'Claro',
-            'quality_score': {
-                'overall_score': 50.0,
-                'speed_score': 55.0,
-                'latency_score': 45.0,
-                'stability_score': 50.0,
-                'rating': 'Fair'
-            }
-        }
-    ]
+    """Sample connectivity data for testing (read-only, shared across the session)."""
+    return SAMPLE_DATA
 
 
 def test_simulate_router_impact(sample_data):
@@ -55,23 +64,27 @@ def test_simulate_router_impact(sample_data):
         assert new_score <= 100
 
 
-def test_simulate_improvement_range(sample_data):
+@pytest.mark.parametrize('seed', [0, 1, 0xC0FFEE, 2**32 - 1])
+def test_simulate_improvement_range(sample_data, seed, monkeypatch):
     """Test that improvement is within expected 15-25% range."""
-    # Run simulation multiple times to check range
-    for _ in range(10):
-        improved_data = simulate_router_impact(sample_data)
-        
-        for i, point in enumerate(improved_data):
-            original_score = sample_data[i]['quality_score']['overall_score']
-            new_score = point['quality_score']['overall_score']
-            
-            # Calculate improvement factor
-            improvement_factor = new_score / original_score if original_score > 0 else 1
-            
-            # Improvement should be between 15% and 25% (factor 1.15 to 1.25)
-            # Allow small margin for rounding
-            assert improvement_factor >= 1.14
-            assert improvement_factor <= 1.26
+    # Each seeded run over a larger batch covers the random range deterministically;
+    # a private generator leaves the global random state untouched for other tests
+    monkeypatch.setattr('src.utils.simulation_utils.random', random.Random(seed))
+    batch = sample_data * 50
+    improved_data = simulate_router_impact(batch)
+    
+    original_scores = np.array([p['quality_score']['overall_score'] for p in batch], dtype=np.float64)
+    new_scores = np.array([p['quality_score']['overall_score'] for p in improved_data], dtype=np.float64)
+    
+    # Calculate improvement factor
+    improvement_factors = np.divide(
+        new_scores, original_scores, out=np.ones_like(original_scores), where=original_scores > 0
+    )
+    
+    # Improvement should be between 15% and 25% (factor 1.15 to 1.25)
+    # Allow small margin for rounding
+    assert np.all(improvement_factors >= 1.14)
+    assert np.all(improvement_factors <= 1.26)
 
 
 def test_simulate_rating_update(sample_data):
@@ -1,10 +1,14 @@
 """Tests for Starlink API utilities."""
 
 import pytest
+import threading
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import requests
 
 from src.utils.starlink_api import (
+    STARLINK_COVERAGE_API,
+    STARLINK_PERFORMANCE_API,
     get_coverage_data,
     get_performance_metrics,
     get_availability_status,
@@ -17,133 +21,155 @@ from src.utils.starlink_api import (
 )
 
 
+def _resp(payload, status=200):
+    """Lightweight stand-in for a successful requests.Response."""
+    return SimpleNamespace(
+        status_code=status,
+        json=lambda p=payload: p,
+        raise_for_status=lambda: None
+    )
+
+
+@pytest.fixture
+def mock_requests_get(monkeypatch):
+    """Replace requests.get used by the Starlink API module with a configurable Mock."""
+    mock_get = Mock()
+    monkeypatch.setattr('src.utils.starlink_api.requests.get', mock_get)
+    return mock_get
+
+
+@pytest.fixture(scope='module')
+def brasilia_comparison():
+    """Provider comparison for Brasília, computed once per module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            'src.utils.starlink_api.requests.get',
+            Mock(side_effect=requests.exceptions.ConnectionError("offline"))
+        )
+        return compare_with_competitors(-15.7801, -47.9292)
+
+
+@pytest.fixture(scope='class')
+def brasilia_sim():
+    """Simulated coverage, performance and availability for Brasília, built once per class."""
+    return SimpleNamespace(
+        cov=_get_simulated_coverage(-15.7801, -47.9292),
+        perf=_get_simulated_performance(-15.7801, -47.9292),
+        avail=_get_simulated_availability(-15.7801, -47.9292)
+    )
+
+
 class TestCoverageData:
     """Test suite for get_coverage_data function."""
     
-    def test_get_coverage_data_api_success(self):
+    def test_get_coverage_data_api_success(self, mock_requests_get):
         """Test successful API call for coverage data."""
-        with patch('requests.get') as mock_get:
-            # Mock successful API response
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                'available': True,
-                'service_tier': 'residential',
-                'expected_download_mbps': 150.0,
-                'monthly_cost_usd': 120
-            }
-            mock_get.return_value = mock_response
-            
-            result = get_coverage_data(-15.7801, -47.9292)
-            
-            assert result is not None
-            assert result['available'] is True
-            assert result['service_tier'] == 'residential'
-            assert result['expected_download_mbps'] == 150.0
-            
-            # Verify API was called with correct params
-            mock_get.assert_called_once()
-            call_args = mock_get.call_args
-            assert call_args[1]['params']['latitude'] == -15.7801
-            assert call_args[1]['params']['longitude'] == -47.9292
+        # Mock successful API response
+        mock_requests_get.return_value = _resp({
+            'available': True,
+            'service_tier': 'residential',
+            'expected_download_mbps': 150.0,
+            'monthly_cost_usd': 120
+        })
+
+        result = get_coverage_data(-15.7801, -47.9292)
+
+        assert result is not None
+        assert result['available'] is True
+        assert result['service_tier'] == 'residential'
+        assert result['expected_download_mbps'] == 150.0
+
+        # Verify API was called with correct params
+        mock_requests_get.assert_called_once()
+        call_args = mock_requests_get.call_args
+        assert call_args[1]['params']['latitude'] == -15.7801
+        assert call_args[1]['params']['longitude'] == -47.9292
     
-    def test_get_coverage_data_api_failure_fallback(self):
+    def test_get_coverage_data_api_failure_fallback(self, mock_requests_get):
         """Test fallback to simulated data when API fails."""
-        with patch('requests.get') as mock_get:
-            # Mock API failure
-            mock_get.side_effect = requests.exceptions.RequestException("API unavailable")
-            
-            result = get_coverage_data(-15.7801, -47.9292)
-            
-            assert result is not None
-            assert 'data_source' in result
-            assert result['data_source'] == 'simulated'
-            assert isinstance(result['available'], bool)
+        # Mock API failure
+        mock_requests_get.side_effect = requests.exceptions.RequestException("API unavailable")
+
+        result = get_coverage_data(-15.7801, -47.9292)
+
+        assert result is not None
+        assert 'data_source' in result
+        assert result['data_source'] == 'simulated'
+        assert isinstance(result['available'], bool)
     
-    def test_get_coverage_data_timeout_fallback(self):
+    def test_get_coverage_data_timeout_fallback(self, mock_requests_get):
         """Test fallback when API times out."""
-        with patch('requests.get') as mock_get:
-            # Mock timeout
-            mock_get.side_effect = requests.exceptions.Timeout("Request timed out")
-            
-            result = get_coverage_data(-15.7801, -47.9292)
-            
-            assert result is not None
-            assert result['data_source'] == 'simulated'
+        # Mock timeout
+        mock_requests_get.side_effect = requests.exceptions.Timeout("Request timed out")
+
+        result = get_coverage_data(-15.7801, -47.9292)
+
+        assert result is not None
+        assert result['data_source'] == 'simulated'
 
 
 class TestPerformanceMetrics:
     """Test suite for get_performance_metrics function."""
     
-    def test_get_performance_metrics_api_success(self):
+    def test_get_performance_metrics_api_success(self, mock_requests_get):
         """Test successful API call for performance metrics."""
-        with patch('requests.get') as mock_get:
-            # Mock successful API response
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                'download_mbps': 165.0,
-                'upload_mbps': 22.0,
-                'latency_ms': 28.0,
-                'uptime_percent': 99.5
-            }
-            mock_get.return_value = mock_response
-            
-            result = get_performance_metrics(-15.7801, -47.9292)
-            
-            assert result is not None
-            assert result['download_mbps'] == 165.0
-            assert result['upload_mbps'] == 22.0
-            assert result['latency_ms'] == 28.0
+        # Mock successful API response
+        mock_requests_get.return_value = _resp({
+            'download_mbps': 165.0,
+            'upload_mbps': 22.0,
+            'latency_ms': 28.0,
+            'uptime_percent': 99.5
+        })
+
+        result = get_performance_metrics(-15.7801, -47.9292)
+
+        assert result is not None
+        assert result['download_mbps'] == 165.0
+        assert result['upload_mbps'] == 22.0
+        assert result['latency_ms'] == 28.0
     
-    def test_get_performance_metrics_api_failure_fallback(self):
+    def test_get_performance_metrics_api_failure_fallback(self, mock_requests_get):
         """Test fallback to simulated data when API fails."""
-        with patch('requests.get') as mock_get:
-            # Mock API failure
-            mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
-            
-            result = get_performance_metrics(-15.7801, -47.9292)
-            
-            assert result is not None
-            assert result['data_source'] == 'simulated'
-            assert 'download_mbps' in result
-            assert 'upload_mbps' in result
-            assert 'latency_ms' in result
+        # Mock API failure
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+
+        result = get_performance_metrics(-15.7801, -47.9292)
+
+        assert result is not None
+        assert result['data_source'] == 'simulated'
+        assert 'download_mbps' in result
+        assert 'upload_mbps' in result
+        assert 'latency_ms' in result
 
 
 class TestAvailabilityStatus:
     """Test suite for get_availability_status function."""
     
-    def test_get_availability_status_api_success(self):
+    def test_get_availability_status_api_success(self, mock_requests_get):
         """Test successful API call for availability status."""
-        with patch('requests.get') as mock_get:
-            # Mock successful API response
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                'service_available': True,
-                'status': 'active',
-                'can_order_now': True
-            }
-            mock_get.return_value = mock_response
-            
-            result = get_availability_status(-15.7801, -47.9292)
-            
-            assert result is not None
-            assert result['service_available'] is True
-            assert result['status'] == 'active'
+        # Mock successful API response
+        mock_requests_get.return_value = _resp({
+            'service_available': True,
+            'status': 'active',
+            'can_order_now': True
+        })
+
+        result = get_availability_status(-15.7801, -47.9292)
+
+        assert result is not None
+        assert result['service_available'] is True
+        assert result['status'] == 'active'
     
-    def test_get_availability_status_api_failure_fallback(self):
+    def test_get_availability_status_api_failure_fallback(self, mock_requests_get):
         """Test fallback to simulated data when API fails."""
-        with patch('requests.get') as mock_get:
-            # Mock API failure
-            mock_get.side_effect = requests.exceptions.HTTPError("500 Server Error")
-            
-            result = get_availability_status(-15.7801, -47.9292)
-            
-            assert result is not None
-            assert result['data_source'] == 'simulated'
-            assert 'service_available' in result
+        # Mock API failure
+        mock_requests_get.side_effect = requests.exceptions.HTTPError("500 Server Error")
+
+        result = get_availability_status(-15.7801, -47.9292)
+
+        assert result is not None
+        assert result['data_source'] == 'simulated'
+        assert 'service_available' in result
 
 
 class TestCompareWithCompetitors:
@@ -186,9 +212,30 @@ class TestCompareWithCompetitors:
             # Starlink should generally have best quality score
             assert result['providers']['starlink']['quality_score'] > 0
     
-    def test_compare_with_competitors_recommendation(self):
-        """Test that recommendation is provided."""
+    def test_compare_with_competitors_fetches_concurrently(self, mock_requests_get):
+        """Test that the Starlink performance and coverage requests are in flight together."""
+        both_in_flight = threading.Barrier(2, timeout=5)
+        payloads = {
+            STARLINK_PERFORMANCE_API: {'download_mbps': 165.0, 'upload_mbps': 22.0, 'latency_ms': 28.0},
+            STARLINK_COVERAGE_API: {'available': True, 'monthly_cost_usd': 99}
+        }
+
+        def get(url, **kwargs):
+            # A sequential caller never gets past this: the barrier breaks and the API call fails
+            both_in_flight.wait()
+            return _resp(payloads[url])
+
+        mock_requests_get.side_effect = get
+
         result = compare_with_competitors(-15.7801, -47.9292)
+
+        assert mock_requests_get.call_count == 2
+        assert result['providers']['starlink']['download_mbps'] == 165.0
+        assert result['providers']['starlink']['monthly_cost_usd'] == 99
+    
+    def test_compare_with_competitors_recommendation(self, brasilia_comparison):
+        """Test that recommendation is provided."""
+        result = brasilia_comparison
         
         assert 'recommendation' in result
         assert 'best_provider' in result['recommendation']
@@ -202,9 +249,9 @@ class TestCompareWithCompetitors:
 class TestSimulatedData:
     """Test suite for simulated data functions."""
     
-    def test_simulated_coverage_brazil_location(self):
+    def test_simulated_coverage_brazil_location(self, brasilia_sim):
         """Test simulated coverage for location in Brazil."""
-        result = _get_simulated_coverage(-15.7801, -47.9292)  # Brasília
+        result = brasilia_sim.cov
         
         assert result is not None
         assert result['available'] is True
@@ -221,9 +268,9 @@ class TestSimulatedData:
         assert result['data_source'] == 'simulated'
         assert result['expected_download_mbps'] == 0
     
-    def test_simulated_performance_returns_valid_data(self):
+    def test_simulated_performance_returns_valid_data(self, brasilia_sim):
         """Test simulated performance returns realistic metrics."""
-        result = _get_simulated_performance(-15.7801, -47.9292)
+        result = brasilia_sim.perf
         
         assert result is not None
         assert result['data_source'] == 'simulated'
@@ -232,9 +279,9 @@ class TestSimulatedData:
         assert result['latency_ms'] > 0
         assert 0 <= result['uptime_percent'] <= 100
     
-    def test_simulated_availability_brazil_location(self):
+    def test_simulated_availability_brazil_location(self, brasilia_sim):
         """Test simulated availability for Brazil location."""
-        result = _get_simulated_availability(-15.7801, -47.9292)
+        result = brasilia_sim.avail
         
         assert result is not None
         assert result['service_available'] is True
@@ -242,93 +289,83 @@ class TestSimulatedData:
         assert result['can_order_now'] is True
 
 
-class TestHelperFunctions:
-    """Test suite for helper functions."""
-    
-    def test_calculate_provider_score_excellent(self):
-        """Test score calculation for excellent performance."""
-        performance_data = {
+PROVIDER_SCORE_CASES = [
+    pytest.param(
+        {
             'download_mbps': 200.0,
             'upload_mbps': 20.0,
             'latency_ms': 20.0,
             'jitter_ms': 2.0,
             'packet_loss_percent': 0.1
-        }
-        
-        score = _calculate_provider_score(performance_data)
-        
-        assert score > 90  # Should be excellent
-        assert 0 <= score <= 100
-    
-    def test_calculate_provider_score_poor(self):
-        """Test score calculation for poor performance."""
-        performance_data = {
+        },
+        lambda score: score > 90,  # Should be excellent
+        id='excellent'
+    ),
+    pytest.param(
+        {
             'download_mbps': 25.0,
             'upload_mbps': 3.0,
             'latency_ms': 700.0,
             'jitter_ms': 50.0,
             'packet_loss_percent': 2.0
-        }
-        
-        score = _calculate_provider_score(performance_data)
-        
-        assert score < 60  # Should be poor/fair
-        assert 0 <= score <= 100
+        },
+        lambda score: score < 60,  # Should be poor/fair
+        id='poor'
+    ),
+    # With all missing data (defaults to 0), score should still be valid
+    pytest.param({}, lambda score: isinstance(score, float), id='missing_data'),
+]
+
+
+class TestHelperFunctions:
+    """Test suite for helper functions."""
     
-    def test_calculate_provider_score_missing_data(self):
-        """Test score calculation with missing data defaults to 0 values."""
-        performance_data = {}
-        
+    @pytest.mark.parametrize('performance_data, check', PROVIDER_SCORE_CASES)
+    def test_calculate_provider_score(self, performance_data, check):
+        """Test score calculation across performance levels."""
         score = _calculate_provider_score(performance_data)
         
-        # With all missing data (defaults to 0), score should still be valid
         assert 0 <= score <= 100
-        assert isinstance(score, float)
+        assert check(score)
     
-    def test_get_recommendation_reason_starlink(self):
-        """Test recommendation reason for Starlink."""
-        reason = _get_recommendation_reason('starlink', {'quality_score': 95})
-        
-        assert 'starlink' in reason.lower() or 'leo' in reason.lower()
-        assert isinstance(reason, str)
-        assert len(reason) > 0
-    
-    def test_get_recommendation_reason_viasat(self):
-        """Test recommendation reason for Viasat."""
-        reason = _get_recommendation_reason('viasat', {'quality_score': 50})
-        
-        assert isinstance(reason, str)
-        assert len(reason) > 0
-    
-    def test_get_recommendation_reason_hughesnet(self):
-        """Test recommendation reason for HughesNet."""
-        reason = _get_recommendation_reason('hughesnet', {'quality_score': 35})
+    @pytest.mark.parametrize('provider, quality_score', [
+        ('starlink', 95),
+        ('viasat', 50),
+        ('hughesnet', 35),
+    ])
+    def test_get_recommendation_reason(self, provider, quality_score):
+        """Test recommendation reason for each satellite provider."""
+        reason = _get_recommendation_reason(provider, {'quality_score': quality_score})
         
         assert isinstance(reason, str)
         assert len(reason) > 0
+        if provider == 'starlink':
+            assert 'starlink' in reason.lower() or 'leo' in reason.lower()
 
 
 class TestEdgeCases:
     """Test suite for edge cases and error handling."""
     
-    def test_coverage_data_with_extreme_coordinates(self):
+    def test_coverage_data_with_extreme_coordinates(self, mock_requests_get):
         """Test coverage data with extreme latitude/longitude."""
         # Should not crash with extreme coordinates
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("offline")
         result = get_coverage_data(-90.0, -180.0)
         
         assert result is not None
         assert 'data_source' in result
     
-    def test_performance_metrics_with_zero_coordinates(self):
+    def test_performance_metrics_with_zero_coordinates(self, mock_requests_get):
         """Test performance metrics with zero coordinates."""
+        mock_requests_get.side_effect = requests.exceptions.ConnectionError("offline")
         result = get_performance_metrics(0.0, 0.0)
         
         assert result is not None
         assert 'download_mbps' in result
     
-    def test_compare_providers_consistent_structure(self):
+    def test_compare_providers_consistent_structure(self, brasilia_comparison):
         """Test that provider comparison always returns consistent structure."""
-        result = compare_with_competitors(-15.7801, -47.9292)
+        result = brasilia_comparison
         
         # Verify structure is always present
         assert 'location' in result
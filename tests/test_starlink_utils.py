@@ -58,6 +58,32 @@ def test_check_batch_availability():
         assert 'service_available' in result
 
 
+def test_check_batch_availability_matches_single_checks():
+    """Test that the vectorized batch check agrees with per-location checks."""
+    coordinates = [
+        (-23.5505, -46.6333),  # Available
+        (-20.0, -55.0),        # Remote Amazon region (waitlist)
+        (-70.0, 10.0),         # Extreme latitude
+        (-61.0, -51.0)         # Both rules apply; waitlist wins
+    ]
+    
+    results = check_batch_availability(coordinates)
+    
+    assert [r['status'] for r in results] == [
+        check_starlink_availability(lat, lon)['status'] for lat, lon in coordinates
+    ]
+    assert [r['status'] for r in results] == ['available', 'waitlist', 'not_available', 'waitlist']
+
+
+def test_check_batch_availability_service_plans_not_shared():
+    """Test that each availability record gets its own service plans list."""
+    results = check_batch_availability([(-23.5505, -46.6333), (-22.9068, -43.1729)])
+    
+    assert results[0]['service_plans'] == results[1]['service_plans']
+    assert results[0]['service_plans'] is not results[1]['service_plans']
+    assert results[0]['service_plans'] is not get_starlink_service_plans()
+
+
 def test_get_starlink_service_plans():
     """Test getting Starlink service plans."""
     plans = get_starlink_service_plans()
@@ -87,6 +113,15 @@ def test_get_starlink_service_plans():
         assert plan['hardware_cost_brl'] > 0
 
 
+def test_get_starlink_lookups_are_cached():
+    """Test that static plans are reused and coverage maps are returned as copies."""
+    assert get_starlink_service_plans() is get_starlink_service_plans()
+    
+    coverage = get_starlink_coverage_map('br')
+    coverage['service_status'] = 'changed'
+    assert get_starlink_coverage_map('BR')['service_status'] == 'active'
+
+
 def test_get_starlink_coverage_map_brazil():
     """Test getting Starlink coverage map for Brazil."""
     coverage = get_starlink_coverage_map('BR')
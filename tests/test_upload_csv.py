@@ -20,6 +20,7 @@ def test_validate_timestamp_valid():
     assert validate_timestamp("2026-01-15T10:30:00")[0] is True
     assert validate_timestamp("2026-01-01T00:00:00")[0] is True
     assert validate_timestamp("2026-12-31T23:59:59")[0] is True
+    assert validate_timestamp("2026-01-15T10:30:00Z")[0] is True
 
 
 def test_validate_timestamp_invalid():
@@ -28,6 +29,8 @@ def test_validate_timestamp_invalid():
     assert validate_timestamp("2026/01/15")[0] is False
     assert validate_timestamp("")[0] is False
     assert validate_timestamp("not-a-date")[0] is False
+    assert validate_timestamp("15/01/2026 10:30")[0] is False
+    assert validate_timestamp(None)[0] is False
 
 
 def test_validate_coordinate_latitude_valid():
@@ -183,6 +186,25 @@ def test_convert_to_json_minimal():
     assert 'city' not in json_data[0]
 
 
+def test_convert_to_json_blank_optional_numeric():
+    """Test that whitespace-only optional numbers, which validate as empty, are left out."""
+    row = {
+        'timestamp': '2026-01-15T10:30:00',
+        'latitude': '-23.5505',
+        'longitude': '-46.6333',
+        'download': '85.2',
+        'upload': '12.5',
+        'latency': '  ',
+        'jitter': '3.1'
+    }
+    
+    assert validate_row(row, 2)[0] is True
+    json_data = convert_to_json([row])
+    
+    assert 'latency' not in json_data[0]
+    assert json_data[0]['jitter'] == 3.1
+
+
 def test_load_and_validate_csv(tmp_path):
     """Test loading and validating a CSV file."""
     # Create a valid CSV file
@@ -231,6 +253,32 @@ def test_load_and_validate_csv_with_errors(tmp_path):
     assert stats['invalid_rows'] == 1
 
 
+def test_load_and_validate_csv_caps_errors(tmp_path, monkeypatch):
+    """Test that error messages stop being kept after MAX_ERRORS while rows are still counted."""
+    import upload_csv
+    monkeypatch.setattr(upload_csv, 'MAX_ERRORS', 3)
+    
+    csv_file = tmp_path / "test_many_errors.csv"
+    csv_file.write_text(
+        "timestamp,latitude,longitude,download,upload\n"
+        + "2026-01-15T10:30:00,95,-200,85.2,12.5\n" * 5
+        + "2026-01-15T10:30:00,-23.5505,-46.6333,85.2,12.5\n",
+        encoding='utf-8'
+    )
+    
+    valid_rows, errors, stats = load_and_validate_csv(str(csv_file))
+    
+    assert len(valid_rows) == 1
+    assert errors == [
+        "Row 2: Latitude must be between -90 and 90, got 95.0",
+        "Row 2: Longitude must be between -180 and 180, got -200.0",
+        "Row 3: Latitude must be between -90 and 90, got 95.0"
+    ]
+    assert stats['invalid_rows'] == 5
+    assert stats['total_errors'] == 10
+    assert stats['errors_truncated'] is True
+
+
 def test_load_and_validate_csv_missing_required_columns(tmp_path):
     """Test loading CSV with missing required columns."""
     # Create a CSV file with missing required columns
@@ -251,6 +299,24 @@ def test_load_and_validate_csv_missing_required_columns(tmp_path):
     assert any('download' in error.lower() or 'upload' in error.lower() for error in errors)
 
 
+def test_load_and_validate_csv_missing_columns_skips_body(tmp_path, monkeypatch):
+    """Test that a bad header fails fast without parsing the data rows."""
+    import upload_csv
+
+    csv_file = tmp_path / "test_missing.csv"
+    csv_file.write_text('timestamp,latitude\n' + '2026-01-15T10:30:00,-23.5505\n' * 100, encoding='utf-8')
+
+    def fail(*args, **kwargs):
+        raise AssertionError('data rows were read')
+
+    monkeypatch.setattr(upload_csv, 'iter_rows', fail)
+    valid_rows, errors, stats = load_and_validate_csv(str(csv_file))
+
+    assert valid_rows == []
+    assert len(errors) == 1
+    assert stats['total_rows'] == 0
+
+
 def test_load_and_validate_csv_file_not_found():
     """Test loading a non-existent CSV file."""
     valid_rows, errors, stats = load_and_validate_csv('/nonexistent/file.csv')
@@ -258,3 +324,185 @@ def test_load_and_validate_csv_file_not_found():
     assert len(valid_rows) == 0
     assert len(errors) > 0
     assert any('not found' in error.lower() for error in errors)
+
+
+@pytest.mark.parametrize('arrow', [False, True], ids=['regex', 'pyarrow'])
+def test_load_and_validate_csv_prescan_matches_row_path(tmp_path, monkeypatch, arrow):
+    """Test that the regex and pyarrow prescans give the same result as the row-by-row path."""
+    import upload_csv
+    if arrow:
+        pytest.importorskip('pyarrow')
+        monkeypatch.setattr(upload_csv, 'ARROW_MIN_BYTES', 0)
+    else:
+        monkeypatch.setattr(upload_csv, 'PYARROW_AVAILABLE', False)
+    
+    csv_file = tmp_path / "test_prescan.csv"
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(
+            f, fieldnames=['timestamp', 'latitude', 'longitude', 'download', 'upload', 'latency', 'city']
+        )
+        writer.writeheader()
+        for i in range(50):
+            writer.writerow({
+                'timestamp': '2026-01-15T10:30:00' if i % 7 else '2026-02-30T10:30:00',
+                'latitude': '-23.5505' if i % 5 else '95',
+                'longitude': '-46.6333' if i % 13 else '-180.5',
+                'download': str(85.2 + i) if i % 11 else '',
+                'upload': '12.5',
+                'latency': '' if i % 3 else '45.3',
+                'city': 'São Paulo, SP' if i % 4 else 'Brasília'
+            })
+        # A quoted line break ends the regex prescan; the remaining rows use validate_row
+        writer.writerow({
+            'timestamp': '2026-01-15T10:30:00', 'latitude': '-23.5505', 'longitude': '-46.6333',
+            'download': '85.2', 'upload': '12.5', 'latency': '', 'city': 'Line\nbreak'
+        })
+        writer.writerow({
+            'timestamp': '2026-01-15T10:30:00', 'latitude': '95', 'longitude': '-46.6333',
+            'download': '85.2', 'upload': '12.5', 'latency': '', 'city': ''
+        })
+    
+    monkeypatch.setattr(upload_csv, 'VALIDATE_CHUNK_ROWS', 16)
+    prescanned = load_and_validate_csv(str(csv_file))
+    monkeypatch.setattr(upload_csv, 'iter_line_masks', lambda *args: iter(()))
+    monkeypatch.setattr(upload_csv, 'iter_arrow_masks', lambda *args: iter(()))
+    row_path = load_and_validate_csv(str(csv_file))
+    
+    assert prescanned == row_path
+    assert 0 < prescanned[2]['valid_rows'] < 52
+
+
+def test_load_and_validate_csv_parallel_matches_serial(tmp_path, monkeypatch):
+    """Test that validating byte ranges in worker processes gives the serial result."""
+    import upload_csv
+    monkeypatch.setattr(upload_csv, 'PARALLEL_MIN_BYTES', 0)
+
+    lines = ['timestamp,latitude,longitude,download,upload,latency,city']
+    for i in range(60):
+        lines.append(','.join([
+            '2026-01-15T10:30:00' if i % 7 else '2026-02-30T10:30:00',
+            '-23.5505' if i % 5 else '95',
+            '-46.6333',
+            str(85.2 + i) if i % 11 else '',
+            '12.5',
+            '' if i % 3 else '45.3',
+            'São Paulo' if i % 4 else ''
+        ]) + ('' if i % 6 else ',extra'))
+    lines[20] = ''  # Blank lines are skipped, not counted
+    csv_file = tmp_path / "test_parallel.csv"
+    csv_file.write_bytes('\r\n'.join(lines).encode('utf-8'))
+
+    assert len(upload_csv.split_byte_ranges(str(csv_file), 3)) == 3
+    assert load_and_validate_csv(str(csv_file), jobs=3) == load_and_validate_csv(str(csv_file))
+
+    # Quotes may hide line breaks, so such files are never split
+    csv_file.write_text('\n'.join(lines + ['2026-01-15T10:30:00,0,0,1,1,,"Line\nbreak"']), encoding='utf-8')
+    assert upload_csv.split_byte_ranges(str(csv_file), 3) is None
+
+
+def test_stream_validate_to_json_matches_save_json(tmp_path):
+    """Test that streamed JSON output is identical to converting and saving in one go."""
+    from upload_csv import stream_validate_to_json, save_json
+    
+    csv_file = tmp_path / "test_stream.csv"
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['timestamp', 'latitude', 'longitude', 'download', 'upload', 'city'])
+        writer.writeheader()
+        writer.writerow({
+            'timestamp': '2026-01-15T10:30:00', 'latitude': '-23.5505', 'longitude': '-46.6333',
+            'download': '85.2', 'upload': '12.5', 'city': 'São Paulo'
+        })
+        writer.writerow({
+            'timestamp': 'invalid', 'latitude': '95', 'longitude': '-46.6333',
+            'download': '-10', 'upload': '12.5', 'city': ''
+        })
+        writer.writerow({
+            'timestamp': '2026-01-16T08:00:00', 'latitude': '-15.7801', 'longitude': '-47.9292',
+            'download': '120', 'upload': '20', 'city': ''
+        })
+    
+    streamed = tmp_path / "streamed.json"
+    errors, stats = stream_validate_to_json(str(csv_file), str(streamed))
+    
+    valid_rows, expected_errors, expected_stats = load_and_validate_csv(str(csv_file))
+    saved = tmp_path / "saved.json"
+    save_json(convert_to_json(valid_rows), str(saved))
+    
+    assert errors == expected_errors
+    assert stats == expected_stats
+    assert streamed.read_text(encoding='utf-8') == saved.read_text(encoding='utf-8')
+    assert len(json.loads(streamed.read_text(encoding='utf-8'))) == 2
+
+
+def test_main_keeps_output_when_validation_fails(tmp_path, monkeypatch):
+    """Test that the CLI only replaces its output file once the whole CSV is valid."""
+    import upload_csv
+    header = "timestamp,latitude,longitude,download,upload\n"
+    valid_row = "2026-01-15T10:30:00,-23.5505,-46.6333,85.2,12.5\n"
+    csv_file = tmp_path / "upload.csv"
+    output_file = tmp_path / "out" / "data.json"
+    argv = ['upload_csv.py', str(csv_file), '--output', str(output_file)]
+    monkeypatch.setattr('sys.argv', argv)
+    
+    csv_file.write_text(header + valid_row, encoding='utf-8')
+    upload_csv.main()
+    saved = output_file.read_bytes()
+    assert json.loads(saved)[0]['download'] == 85.2
+    
+    csv_file.write_text(header + valid_row + "2026-01-15T10:30:00,95,-46.6333,85.2,12.5\n", encoding='utf-8')
+    with pytest.raises(SystemExit):
+        upload_csv.main()
+    
+    assert output_file.read_bytes() == saved
+    assert [path.name for path in output_file.parent.iterdir()] == ['data.json']
+
+
+def test_stream_validate_to_parquet_matches_json(tmp_path):
+    """Test that the Parquet output holds the same valid rows as the JSON output."""
+    pq = pytest.importorskip('pyarrow.parquet')
+    from upload_csv import stream_validate_to_json, stream_validate_to_parquet, ALL_FIELDS
+    
+    csv_file = tmp_path / "test_parquet.csv"
+    csv_file.write_text(
+        "timestamp,latitude,longitude,download,upload,city,latency\n"
+        "2026-01-15T10:30:00,-23.5505,-46.6333,85.2,12.5,São Paulo,45.3\n"
+        "2026-01-15T11:00:00,95,-46.6333,85.2,12.5,,\n"
+        "2026-01-15T11:30:00,-22.9068,-43.1729,92.1,15.3,,\n",
+        encoding='utf-8'
+    )
+    json_file = tmp_path / "out.json"
+    parquet_file = tmp_path / "out" / "data.parquet"
+    
+    json_result = stream_validate_to_json(str(csv_file), str(json_file))
+    parquet_result = stream_validate_to_parquet(str(csv_file), str(parquet_file))
+    
+    assert parquet_result == json_result
+    table = pq.read_table(parquet_file)
+    assert table.column_names == ALL_FIELDS
+    expected = [dict.fromkeys(ALL_FIELDS) | entry for entry in json.loads(json_file.read_bytes())]
+    assert table.to_pylist() == expected
+
+
+def test_stream_validate_to_json_keeps_non_finite_values(tmp_path):
+    """Test that NaN and Infinity values accepted by the validators are written like the json module."""
+    from upload_csv import stream_validate_to_json
+    
+    csv_file = tmp_path / "test_non_finite.csv"
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['timestamp', 'latitude', 'longitude', 'download', 'upload'])
+        writer.writeheader()
+        writer.writerow({
+            'timestamp': '2026-01-15T10:30:00', 'latitude': 'nan', 'longitude': '-46.6333',
+            'download': 'inf', 'upload': '12.5'
+        })
+    
+    output = tmp_path / "output.json"
+    errors, stats = stream_validate_to_json(str(csv_file), str(output))
+    
+    valid_rows, _, _ = load_and_validate_csv(str(csv_file))
+    expected = json.dumps(convert_to_json(valid_rows), indent=2, ensure_ascii=False)
+    
+    assert errors == []
+    assert stats['valid_rows'] == 1
+    assert output.read_text(encoding='utf-8') == expected
+    assert 'NaN' in expected and 'Infinity' in expected
@@ -11,27 +11,20 @@ from src.utils.validation_utils import (
 from src.models import SpeedTest
 
 
-def test_validate_coordinates_valid():
-    """Test validation of valid coordinates."""
-    # Valid coordinates
-    assert validate_coordinates(0, 0) is True
-    assert validate_coordinates(-23.5505, -46.6333) is True  # São Paulo
-    assert validate_coordinates(90, 180) is True  # Max valid
-    assert validate_coordinates(-90, -180) is True  # Min valid
-
-
-def test_validate_coordinates_invalid():
-    """Test validation of invalid coordinates."""
-    # Invalid latitude
-    assert validate_coordinates(91, 0) is False
-    assert validate_coordinates(-91, 0) is False
-
-    # Invalid longitude
-    assert validate_coordinates(0, 181) is False
-    assert validate_coordinates(0, -181) is False
-
-    # Both invalid
-    assert validate_coordinates(100, 200) is False
+@pytest.mark.parametrize('lat, lon, expected', [
+    (0, 0, True),
+    (-23.5505, -46.6333, True),  # São Paulo
+    (90, 180, True),  # Max valid
+    (-90, -180, True),  # Min valid
+    (91, 0, False),  # Invalid latitude
+    (-91, 0, False),
+    (0, 181, False),  # Invalid longitude
+    (0, -181, False),
+    (100, 200, False),  # Both invalid
+])
+def test_validate_coordinates(lat, lon, expected):
+    """Test validation of coordinates."""
+    assert validate_coordinates(lat, lon) is expected
 
 
 def test_validate_speed_test_valid():
@@ -56,65 +49,30 @@ def test_validate_speed_test_valid():
     assert validate_speed_test(speed_dict) is True
 
 
-def test_validate_speed_test_invalid():
-    """Test validation of invalid speed test data."""
-    # Negative values
-    invalid_dict = {
-        'download': -10.0,
-        'upload': 15.0,
-        'latency': 30.0
-    }
-
-    assert validate_speed_test(invalid_dict) is False
-
-    # Missing required fields
-    incomplete_dict = {
-        'download': 100.0
-    }
-
-    assert validate_speed_test(incomplete_dict) is False
-
-
-def test_validate_speed_test_bounds():
-    """Test validation with bounds checking."""
-    # Out of bounds download speed
-    invalid_dict = {
-        'download': 2000.0,  # Too high
-        'upload': 15.0,
-        'latency': 30.0
-    }
-    assert validate_speed_test(invalid_dict, check_bounds=True) is False
-
-    # Out of bounds latency
-    invalid_dict = {
-        'download': 100.0,
-        'upload': 15.0,
-        'latency': 5000.0  # Too high
-    }
-    assert validate_speed_test(invalid_dict, check_bounds=True) is False
-
-    # Valid within bounds
-    valid_dict = {
-        'download': 100.0,
-        'upload': 15.0,
-        'latency': 30.0
-    }
-    assert validate_speed_test(valid_dict, check_bounds=True) is True
-
-
-def test_validate_provider_valid():
-    """Test validation of valid provider names."""
-    assert validate_provider('Starlink') is True
-    assert validate_provider('Viasat') is True
-    assert validate_provider('HughesNet') is True
-    assert validate_provider('Claro') is True
-
-
-def test_validate_provider_invalid():
-    """Test validation of invalid provider names."""
-    assert validate_provider('Unknown Provider') is False
-    assert validate_provider('') is False
-    assert validate_provider(None) is False
+@pytest.mark.parametrize('speed_dict, check_bounds, expected', [
+    ({'download': -10.0, 'upload': 15.0, 'latency': 30.0}, True, False),  # Negative values
+    ({'download': 100.0}, True, False),  # Missing required fields
+    ({'download': 2000.0, 'upload': 15.0, 'latency': 30.0}, True, False),  # Download too high
+    ({'download': 100.0, 'upload': 15.0, 'latency': 5000.0}, True, False),  # Latency too high
+    ({'download': 100.0, 'upload': 15.0, 'latency': 30.0}, True, True),  # Valid within bounds
+])
+def test_validate_speed_test_dict(speed_dict, check_bounds, expected):
+    """Test validation of speed test dictionaries, with and without bounds checking."""
+    assert validate_speed_test(speed_dict, check_bounds=check_bounds) is expected
+
+
+@pytest.mark.parametrize('provider, expected', [
+    ('Starlink', True),
+    ('Viasat', True),
+    ('HughesNet', True),
+    ('Claro', True),
+    ('Unknown Provider', False),
+    ('', False),
+    (None, False),
+])
+def test_validate_provider(provider, expected):
+    """Test validation of provider names."""
+    assert validate_provider(provider) is expected
 
 
 def test_validate_csv_row_valid():
@@ -135,62 +93,24 @@ def test_validate_csv_row_valid():
     assert error_msg == ""
 
 
-def test_validate_csv_row_missing_fields():
-    """Test validation with missing required fields."""
-    row = {
-        'latitude': '-23.5505',
-        'provider': 'Starlink',
-        'download': '100.0'
-    }
-
-    is_valid, error_msg = validate_csv_row(row, 1)
-    assert is_valid is False
-    assert "Missing required fields" in error_msg
-
-
-def test_validate_csv_row_invalid_numeric():
-    """Test validation with invalid numeric values."""
-    row = {
-        'latitude': 'invalid',
-        'longitude': '-46.6333',
-        'provider': 'Starlink',
-        'download': '100.0',
-        'upload': '15.0',
-        'latency': '30.0'
-    }
-
-    is_valid, error_msg = validate_csv_row(row, 1)
-    assert is_valid is False
-    assert "Invalid numeric value" in error_msg
-
-
-def test_validate_csv_row_out_of_range_coordinates():
-    """Test validation with out of range coordinates."""
-    row = {
-        'latitude': '95.0',  # Invalid
-        'longitude': '-46.6333',
-        'provider': 'Starlink',
-        'download': '100.0',
-        'upload': '15.0',
-        'latency': '30.0'
-    }
-
-    is_valid, error_msg = validate_csv_row(row, 1)
-    assert is_valid is False
-    assert "Invalid latitude" in error_msg
-
-
-def test_validate_csv_row_out_of_range_speed():
-    """Test validation with out of range speed values."""
-    row = {
-        'latitude': '-23.5505',
-        'longitude': '-46.6333',
-        'provider': 'Starlink',
-        'download': '5000.0',  # Too high
-        'upload': '15.0',
-        'latency': '30.0'
-    }
-
+VALID_CSV_ROW = {
+    'latitude': '-23.5505',
+    'longitude': '-46.6333',
+    'provider': 'Starlink',
+    'download': '100.0',
+    'upload': '15.0',
+    'latency': '30.0'
+}
+
+
+@pytest.mark.parametrize('row, message', [
+    ({'latitude': '-23.5505', 'provider': 'Starlink', 'download': '100.0'}, "Missing required fields"),
+    ({**VALID_CSV_ROW, 'latitude': 'invalid'}, "Invalid numeric value"),
+    ({**VALID_CSV_ROW, 'latitude': '95.0'}, "Invalid latitude"),
+    ({**VALID_CSV_ROW, 'download': '5000.0'}, "Invalid download"),  # Too high
+], ids=['missing_fields', 'invalid_numeric', 'out_of_range_coordinates', 'out_of_range_speed'])
+def test_validate_csv_row_invalid(row, message):
+    """Test validation of invalid CSV rows."""
     is_valid, error_msg = validate_csv_row(row, 1)
     assert is_valid is False
-    assert "Invalid download" in error_msg
+    assert message in error_msg
@@ -28,16 +28,31 @@ Optional CSV Columns:
 
 import argparse  # noqa: I001
 import csv
-import json
+import mmap
+import multiprocessing
+import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, pairwise, repeat
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 # Schema validation constants
 REQUIRED_FIELDS = ['timestamp', 'latitude', 'longitude', 'download', 'upload']
 OPTIONAL_FIELDS = ['id', 'city', 'provider', 'latency', 'jitter', 'packet_loss']
 ALL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
+OPTIONAL_NUMERIC_FIELDS = ('latency', 'jitter', 'packet_loss')
 
 # Coordinate validation ranges
 LATITUDE_MIN = -90
@@ -47,8 +62,41 @@ LONGITUDE_MAX = 180
 
 # Error reporting constants
 MAX_ERRORS_DISPLAYED = 20
+MAX_ERRORS = 1000  # Messages kept per file; further invalid rows are only counted
 CSV_HEADER_ROW: int = 1  # Row 1 is header, data starts at row 2
 
+# Rows read and validated per batch, bounding memory for large files
+VALIDATE_CHUNK_ROWS = 10000
+# Files from this size on are prescanned with pyarrow's multi-threaded CSV parser
+ARROW_MIN_BYTES = 1024 * 1024
+# Files from this size on are split across worker processes when --jobs > 1
+PARALLEL_MIN_BYTES = 10 * 1024 * 1024
+
+# Raw-bytes patterns for cells that validate_row always accepts. They are
+# stricter than the validators (plain decimals only, years from 0001, no
+# February 29th so the date exists in every year); cells that do not match
+# simply go through validate_row. They avoid lookarounds so pyarrow's RE2
+# engine accepts them too.
+_UNSIGNED_DECIMAL = rb'\d+(?:\.\d*)?'
+_YEAR = rb'(?:[1-9]\d{3}|0[1-9]\d{2}|00[1-9]\d|000[1-9])'
+_MONTH_DAY = rb'(?:(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])|(?:0[13-9]|1[0-2])-(?:29|30)|(?:0[13578]|1[02])-31)'
+_CELL_PATTERNS = {
+    'timestamp': _YEAR + rb'-' + _MONTH_DAY + rb'T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d',
+    'latitude': rb'-?(?:90(?:\.0*)?|[1-8]?\d(?:\.\d*)?)',
+    'longitude': rb'-?(?:180(?:\.0*)?|(?:1[0-7]\d|\d?\d)(?:\.\d*)?)',
+    'download': _UNSIGNED_DECIMAL,
+    'upload': _UNSIGNED_DECIMAL,
+    'latency': rb'(?:' + _UNSIGNED_DECIMAL + rb')?',
+    'jitter': rb'(?:' + _UNSIGNED_DECIMAL + rb')?',
+    'packet_loss': rb'(?:' + _UNSIGNED_DECIMAL + rb')?'
+}
+# Any other column: an unquoted cell, or a quoted one without line breaks
+_TEXT_CELL_PATTERN = rb'[^,"\r\n]*|"(?:[^"\r\n]|"")*"'
+
+
+class CSVSchemaError(ValueError):
+    """Raised when a CSV header does not match the expected schema."""
+
 
 def validate_timestamp(timestamp_str: str) -> tuple[bool, str]:
     """Validate timestamp format.
@@ -56,24 +104,74 @@ def validate_timestamp(timestamp_str: str) -> tuple[bool, str]:
     Args:
         timestamp_str: Timestamp string to validate
 
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    # Every ISO format starts with a four-digit year; rejecting anything else
+    # up front avoids raising and catching an exception for malformed values
+    if isinstance(timestamp_str, str) and timestamp_str[:4].isdigit():
+        try:
+            # Try parsing ISO format
+            # Note: a trailing UTC indicator 'Z' is rewritten to '+00:00' for ISO 8601 compatibility;
+            # the common case without it goes straight to the C parser
+            if timestamp_str.endswith('Z'):
+                datetime.fromisoformat(timestamp_str[:-1] + '+00:00')
+            else:
+                datetime.fromisoformat(timestamp_str)
+            return True, ""
+        except ValueError:
+            pass
+
+    return False, (
+        f"Invalid timestamp format: '{timestamp_str}'. "
+        "Expected ISO format (e.g., 2026-01-15T10:30:00)"
+    )
+
+
+def validate_latitude(value: str) -> tuple[bool, str]:
+    """Validate a latitude value.
+
+    Args:
+        value: Latitude value to validate
+
     Returns:
         Tuple of (is_valid, error_message)
     """
     try:
-        # Try parsing ISO format
-        # Note: replace('Z', '+00:00') handles UTC timezone indicator 'Z' for ISO 8601 compatibility
-        datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        return True, ""
-    except (ValueError, AttributeError):
-        return False, (
-            f"Invalid timestamp format: '{timestamp_str}'. "
-            "Expected ISO format (e.g., 2026-01-15T10:30:00)"
-        )
+        coord = float(value)
+    except (ValueError, TypeError):
+        return False, f"Invalid latitude: '{value}'. Must be a number"
+
+    if coord < LATITUDE_MIN or coord > LATITUDE_MAX:
+        return False, f"Latitude must be between {LATITUDE_MIN} and {LATITUDE_MAX}, got {coord}"
+    return True, ""
+
+
+def validate_longitude(value: str) -> tuple[bool, str]:
+    """Validate a longitude value.
+
+    Args:
+        value: Longitude value to validate
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    try:
+        coord = float(value)
+    except (ValueError, TypeError):
+        return False, f"Invalid longitude: '{value}'. Must be a number"
+
+    if coord < LONGITUDE_MIN or coord > LONGITUDE_MAX:
+        return False, f"Longitude must be between {LONGITUDE_MIN} and {LONGITUDE_MAX}, got {coord}"
+    return True, ""
 
 
 def validate_coordinate(value: str, coord_type: str) -> tuple[bool, str]:
     """Validate latitude or longitude.
 
+    Dispatches to validate_latitude or validate_longitude; validate_row calls
+    those directly.
+
     Args:
         value: Coordinate value to validate
         coord_type: Either 'latitude' or 'longitude'
@@ -81,16 +179,13 @@ def validate_coordinate(value: str, coord_type: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    try:
-        coord = float(value)
-
-        if coord_type == 'latitude':
-            if coord < LATITUDE_MIN or coord > LATITUDE_MAX:
-                return False, f"Latitude must be between {LATITUDE_MIN} and {LATITUDE_MAX}, got {coord}"
-        elif coord_type == 'longitude':
-            if coord < LONGITUDE_MIN or coord > LONGITUDE_MAX:
-                return False, f"Longitude must be between {LONGITUDE_MIN} and {LONGITUDE_MAX}, got {coord}"
+    if coord_type == 'latitude':
+        return validate_latitude(value)
+    if coord_type == 'longitude':
+        return validate_longitude(value)
 
+    try:
+        float(value)
         return True, ""
     except (ValueError, TypeError):
         return False, f"Invalid {coord_type}: '{value}'. Must be a number"
@@ -150,7 +245,7 @@ def validate_row(row: dict[str, str], row_num: int) -> tuple[bool, list[str]]:
 
     # Check required fields exist
     for field in REQUIRED_FIELDS:
-        if field not in row or not row[field]:
+        if not row.get(field):
             errors.append(f"Row {row_num}: Missing required field '{field}'")
 
     if errors:
@@ -162,12 +257,12 @@ def validate_row(row: dict[str, str], row_num: int) -> tuple[bool, list[str]]:
         errors.append(f"Row {row_num}: {error}")
 
     # Validate latitude
-    is_valid, error = validate_coordinate(row['latitude'], 'latitude')
+    is_valid, error = validate_latitude(row['latitude'])
     if not is_valid:
         errors.append(f"Row {row_num}: {error}")
 
     # Validate longitude
-    is_valid, error = validate_coordinate(row['longitude'], 'longitude')
+    is_valid, error = validate_longitude(row['longitude'])
     if not is_valid:
         errors.append(f"Row {row_num}: {error}")
 
@@ -181,78 +276,531 @@ def validate_row(row: dict[str, str], row_num: int) -> tuple[bool, list[str]]:
     if not is_valid:
         errors.append(f"Row {row_num}: {error}")
 
-    # Validate optional numeric fields
-    for field in ['latency', 'jitter', 'packet_loss']:
-        if field in row:
-            is_valid, error = validate_optional_numeric(row.get(field, ''), field)
+    # Validate optional numeric fields; absent and empty values are both accepted
+    for field in OPTIONAL_NUMERIC_FIELDS:
+        value = row.get(field)
+        if value:
+            is_valid, error = validate_optional_numeric(value, field)
             if not is_valid:
                 errors.append(f"Row {row_num}: {error}")
 
     return len(errors) == 0, errors
 
 
-def load_and_validate_csv(csv_path: str) -> tuple[list[dict[str, str]], list[str], dict[str, int | dict[str, int]]]:
-    """Load and validate CSV file.
+def line_pattern(fieldnames: list[str]) -> re.Pattern[bytes]:
+    """Compile a regex matching a whole raw CSV line that validate_row accepts.
+
+    Args:
+        fieldnames: CSV header fields, in file order
+
+    Returns:
+        Compiled bytes pattern, to be used with fullmatch on a line without
+        its line terminator
+    """
+    return re.compile(rb','.join(
+        rb'(?:' + _CELL_PATTERNS.get(field, _TEXT_CELL_PATTERN) + rb')' for field in fieldnames
+    ))
+
+
+def iter_line_masks(csv_path: str, fieldnames: list[str]) -> Iterator[list[bool]]:
+    """Yield validity masks for consecutive VALIDATE_CHUNK_ROWS-row chunks of a CSV file.
+
+    The file is scanned a second time in binary mode and each line is checked
+    with a single compiled regex (see line_pattern), which is much cheaper than
+    running the per-field validators. A True entry guarantees that validate_row
+    accepts the row; False only means the row must go through validate_row,
+    which also builds the error messages. Iteration stops at the first line
+    that may not be exactly one CSV record (quotes or a bare carriage return),
+    since lines and rows can drift apart from there.
 
     Args:
         csv_path: Path to CSV file
+        fieldnames: CSV header fields
+
+    Yields:
+        List of booleans per chunk, one per data row
+    """
+    fullmatch = line_pattern(fieldnames).fullmatch
+    mask: list[bool] = []
+    with open(csv_path, 'rb') as f:
+        header = f.readline()
+        if b'"' in header:
+            return
+        for line in f:
+            content = line.rstrip(b'\r\n')
+            if not content:
+                continue  # csv.reader skips blank lines as well
+            matched = fullmatch(content) is not None
+            if not matched and (b'"' in content or b'\r' in content):
+                return
+            mask.append(matched)
+            if len(mask) == VALIDATE_CHUNK_ROWS:
+                yield mask
+                mask = []
+    if mask:
+        yield mask
+
+
+def iter_arrow_masks(csv_path: str, fieldnames: list[str]) -> Iterator[list[bool]]:
+    """Yield validity masks for consecutive VALIDATE_CHUNK_ROWS-row chunks, using pyarrow.
+
+    Same contract as iter_line_masks, but the validated columns are parsed as
+    strings by pyarrow's streaming CSV reader and matched column-wise against
+    the _CELL_PATTERNS. Quoted line breaks are handled like the csv module
+    does. Iteration stops if pyarrow cannot parse the file (e.g. ragged rows).
+
+    Args:
+        csv_path: Path to CSV file
+        fieldnames: CSV header fields, without duplicates
+
+    Yields:
+        List of booleans per chunk, one per data row
+    """
+    checked = [field for field in fieldnames if field in _CELL_PATTERNS]
+    patterns = {field: '^(?:' + _CELL_PATTERNS[field].decode() + ')$' for field in checked}
+    pending: list[bool] = []
+    try:
+        reader = pa_csv.open_csv(
+            csv_path,
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=checked,
+                column_types=dict.fromkeys(checked, pa.string()),
+                strings_can_be_null=False
+            )
+        )
+        for batch in reader:
+            mask = None
+            for field in checked:
+                matched = pc.match_substring_regex(batch.column(field), patterns[field])
+                mask = matched if mask is None else pc.and_(mask, matched)
+            pending.extend(mask.to_pylist())
+            while len(pending) >= VALIDATE_CHUNK_ROWS:
+                yield pending[:VALIDATE_CHUNK_ROWS]
+                del pending[:VALIDATE_CHUNK_ROWS]
+    except pa.ArrowInvalid:
+        return
+    if pending:
+        yield pending
+
+
+def iter_rows(reader: Iterator[list[str]], fieldnames: list[str]) -> Iterator[dict[str, str]]:
+    """Turn csv.reader rows into dictionaries keyed by the header.
+
+    Equivalent to csv.DictReader without its per-row method overhead: blank
+    lines are skipped, short rows are padded with None and extra values are
+    collected in a list under the None key.
+
+    Args:
+        reader: csv.reader positioned after the header
+        fieldnames: CSV header fields
+
+    Yields:
+        Dictionary per data row
+    """
+    n_fields = len(fieldnames)
+    for values in reader:
+        if len(values) == n_fields:
+            yield dict(zip(fieldnames, values, strict=True))
+        elif values:
+            # Ragged row: pair up what is there, then pad or collect the rest
+            row = dict(zip(fieldnames, values, strict=False))
+            if len(values) > n_fields:
+                row[None] = values[n_fields:]
+            else:
+                for field in fieldnames[len(values):]:
+                    row[field] = None
+            yield row
+
+
+def split_byte_ranges(csv_path: str, jobs: int) -> list[tuple[int, int]] | None:
+    """Split the data rows of a CSV file into byte ranges aligned on line breaks.
+
+    Splitting is only safe when every line is exactly one CSV record, so files
+    containing quotes or NUL bytes are not split, and neither are files below
+    PARALLEL_MIN_BYTES, where starting worker processes costs more than it saves.
+    The file is memory-mapped, so scanning it does not copy it through Python
+    buffers and the workers reading their ranges share the same cached pages.
+
+    Args:
+        csv_path: Path to CSV file
+        jobs: Number of ranges to aim for
 
     Returns:
-        Tuple of (valid_rows, errors, statistics)
+        List of (start, end) byte offsets covering everything after the header,
+        or None if the file should be read as a whole
     """
-    valid_rows: list[dict[str, str]] = []
-    all_errors: list[str] = []
-    stats: dict[str, int | dict[str, int]] = {
+    size = Path(csv_path).stat().st_size
+    if jobs < 2 or size < PARALLEL_MIN_BYTES:
+        return None
+
+    with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        header_end = mm.find(b'\n') + 1
+        if not header_end or b'\r' in mm[:header_end].rstrip(b'\r\n'):
+            return None
+        if mm.find(b'"') != -1 or mm.find(b'\0') != -1:
+            return None
+
+        bounds = [header_end]
+        for i in range(1, jobs):
+            # Search from one byte back so a line starting exactly at the split point is kept
+            line_end = mm.find(b'\n', max(header_end, size * i // jobs) - 1)
+            bounds.append(size if line_end == -1 else line_end + 1)
+        bounds.append(size)
+
+    return [(start, end) for start, end in pairwise(bounds) if start < end]
+
+
+def _validate_byte_range(
+    csv_path: str,
+    fieldnames: list[str],
+    start: int,
+    end: int
+) -> tuple[list[dict[str, str]], list[bool]]:
+    """Read and check the rows in one byte range of a quote-free CSV file.
+
+    Runs in a worker process. Without quotes each non-blank line is one record
+    whose values are separated by plain commas, split on the same line breaks
+    as the text-mode reader in iter_validate.
+
+    Args:
+        csv_path: Path to CSV file
+        fieldnames: CSV header fields
+        start: Offset of the first byte of the range
+        end: Offset just past the last byte of the range
+
+    Returns:
+        Tuple of (rows, valid_flags) with one flag per row
+    """
+    with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = [line for line in mm[start:end].splitlines() if line]
+
+    fullmatch = line_pattern(fieldnames).fullmatch
+    rows = list(iter_rows((line.decode('utf-8').split(',') for line in lines), fieldnames))
+    valid = [
+        fullmatch(line) is not None or validate_row(row, 0)[0]
+        for line, row in zip(lines, rows, strict=True)
+    ]
+    return rows, valid
+
+
+def _iter_validate_parallel(
+    csv_path: str,
+    fieldnames: list[str],
+    ranges: list[tuple[int, int]]
+) -> Iterator[tuple[int, dict[str, str], list[str]]]:
+    """Validate byte ranges of a CSV file in worker processes, yielding rows in file order.
+
+    Workers only report which rows are valid; the few invalid rows are
+    validated again here so their errors carry file-wide row numbers.
+    Workers are spawned rather than forked: forking after a threaded library
+    (e.g. a parallel Numba kernel) has started its thread pool can deadlock.
+    """
+    starts, ends = zip(*ranges, strict=True)
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=multiprocessing.get_context('spawn')) as pool:
+        results = pool.map(_validate_byte_range, repeat(csv_path), repeat(fieldnames), starts, ends)
+        row_num = CSV_HEADER_ROW
+        for rows, valid in results:
+            for row, is_valid in zip(rows, valid, strict=True):
+                row_num += 1
+                yield row_num, row, [] if is_valid else validate_row(row, row_num)[1]
+
+
+def iter_validate(csv_path: str, jobs: int = 1) -> Iterator[tuple[int, dict[str, str], list[str]]]:
+    """Validate a CSV file row by row without holding the whole file in memory.
+
+    Rows are read in chunks of VALIDATE_CHUNK_ROWS. Each chunk is first checked
+    line by line with one compiled regex (see iter_line_masks), or column-wise
+    by pyarrow for files of at least ARROW_MIN_BYTES when it is installed, and
+    only rows failing that check go through validate_row.
+
+    With jobs > 1, files that split_byte_ranges accepts are instead read and
+    validated by that many worker processes, one byte range each; every
+    range is held in memory at once.
+
+    Args:
+        csv_path: Path to CSV file
+        jobs: Number of worker processes for large files
+
+    Yields:
+        Tuple of (row_number, row, list_of_errors); the error list is empty for valid rows
+
+    Raises:
+        CSVSchemaError: If the header is empty or misses required fields
+        OSError, csv.Error, UnicodeDecodeError: If the file cannot be read
+    """
+    with open(csv_path, 'r', encoding='utf-8') as f:  # noqa: UP015
+        reader = csv.reader(f)
+        fieldnames = next(reader, None)
+
+        # Check if required fields are in header
+        if not fieldnames:
+            raise CSVSchemaError("CSV file is empty or has no header")
+
+        missing_required = set(REQUIRED_FIELDS) - set(fieldnames)
+        if missing_required:
+            raise CSVSchemaError(f"CSV header missing required fields: {', '.join(missing_required)}")
+
+        ranges = split_byte_ranges(csv_path, jobs)
+        if ranges:
+            yield from _iter_validate_parallel(csv_path, fieldnames, ranges)
+            return
+
+        rows = iter_rows(reader, fieldnames)
+        use_arrow = (
+            PYARROW_AVAILABLE
+            and len(set(fieldnames)) == len(fieldnames)
+            and Path(csv_path).stat().st_size >= ARROW_MIN_BYTES
+        )
+        masks = iter_arrow_masks(csv_path, fieldnames) if use_arrow else iter_line_masks(csv_path, fieldnames)
+        row_num = CSV_HEADER_ROW
+        while True:
+            chunk = list(islice(rows, VALIDATE_CHUNK_ROWS))
+            if not chunk:
+                break
+
+            fast_valid = next(masks, None) if masks is not None else None
+            if fast_valid is not None and len(fast_valid) != len(chunk):
+                # Raw lines and csv rows disagree; stay on the row-by-row path
+                masks = fast_valid = None
+
+            for offset, row in enumerate(chunk):
+                row_num += 1
+                if fast_valid is not None and fast_valid[offset]:
+                    yield row_num, row, []
+                else:
+                    yield row_num, row, validate_row(row, row_num)[1]
+
+
+def _new_stats() -> dict[str, int | dict[str, int]]:
+    """Create an empty validation statistics dictionary."""
+    return {
         'total_rows': 0,
         'valid_rows': 0,
         'invalid_rows': 0,
-        'missing_optional_fields': {}
+        'missing_optional_fields': {},
+        'total_errors': 0,
+        'errors_truncated': False
     }
-    # Type assertions for stats counters
-    assert isinstance(stats['total_rows'], int)
-    assert isinstance(stats['valid_rows'], int)
-    assert isinstance(stats['invalid_rows'], int)
-    assert isinstance(stats['missing_optional_fields'], dict)
 
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as f:  # noqa: UP015
-            reader = csv.DictReader(f)
 
-            # Check if required fields are in header
-            if not reader.fieldnames:
-                return [], ["CSV file is empty or has no header"], stats
+def _count_row(stats: dict, row: dict[str, str], errors: list[str]) -> bool:
+    """Update validation statistics for one row.
 
-            missing_required = set(REQUIRED_FIELDS) - set(reader.fieldnames)
-            if missing_required:
-                return [], [f"CSV header missing required fields: {', '.join(missing_required)}"], stats
+    Returns:
+        True if the row is valid
+    """
+    stats['total_rows'] += 1
 
-            # Process each row
-            for row_num, row in enumerate(reader, start=2):
-                stats['total_rows'] += 1
+    if errors:
+        stats['invalid_rows'] += 1
+        return False
 
-                is_valid, errors = validate_row(row, row_num)
+    # Track missing optional fields
+    missing_optional = stats['missing_optional_fields']
+    for field in OPTIONAL_FIELDS:
+        if not row.get(field):
+            missing_optional[field] = missing_optional.get(field, 0) + 1
 
-                if is_valid:
-                    # Track missing optional fields
-                    for field in OPTIONAL_FIELDS:
-                        if field not in row or not row[field]:
-                            stats['missing_optional_fields'][field] = \
-                                stats['missing_optional_fields'].get(field, 0) + 1
+    stats['valid_rows'] += 1
+    return True
 
-                    valid_rows.append(row)
-                    stats['valid_rows'] += 1
-                else:
-                    all_errors.extend(errors)
-                    stats['invalid_rows'] += 1
+
+def _collect_errors(all_errors: list[str], errors: list[str], stats: dict) -> None:
+    """Add a row's error messages, keeping at most MAX_ERRORS in total."""
+    stats['total_errors'] += len(errors)
+    room = MAX_ERRORS - len(all_errors)
+    if len(errors) > room:
+        errors = errors[:room]
+        stats['errors_truncated'] = True
+    all_errors.extend(errors)
+
+
+def load_and_validate_csv(
+    csv_path: str,
+    jobs: int = 1
+) -> tuple[list[dict[str, str]], list[str], dict[str, int | dict[str, int]]]:
+    """Load and validate CSV file.
+
+    Args:
+        csv_path: Path to CSV file
+        jobs: Number of worker processes for large files (see iter_validate)
+
+    Returns:
+        Tuple of (valid_rows, errors, statistics); at most MAX_ERRORS error
+        messages are kept, with statistics['errors_truncated'] set if more occurred
+        and statistics['total_errors'] counting all of them
+    """
+    valid_rows: list[dict[str, str]] = []
+    all_errors: list[str] = []
+    stats = _new_stats()
+
+    try:
+        for _, row, errors in iter_validate(csv_path, jobs):
+            if _count_row(stats, row, errors):
+                valid_rows.append(row)
+            else:
+                _collect_errors(all_errors, errors, stats)
 
         return valid_rows, all_errors, stats
 
+    except CSVSchemaError as e:
+        return [], [str(e)], stats
     except FileNotFoundError:
         return [], [f"File not found: {csv_path}"], stats
     except (IOError, OSError, csv.Error, UnicodeDecodeError) as e:  # noqa: UP024
         return [], [f"Error reading CSV file: {str(e)}"], stats
 
 
+def _iter_converted_batches(
+    csv_path: str,
+    jobs: int,
+    stats: dict,
+    all_errors: list[str]
+) -> Iterator[list[dict[str, str | float]]]:
+    """Validate a CSV file and yield its valid rows, converted, in batches of up to VALIDATE_CHUNK_ROWS.
+
+    Statistics and errors are recorded into stats and all_errors as rows are
+    read. The last batch may be empty.
+    """
+    pending: list[dict[str, str | float]] = []
+    for _, row, errors in iter_validate(csv_path, jobs):
+        if _count_row(stats, row, errors):
+            pending.append(convert_row(row))
+            if len(pending) >= VALIDATE_CHUNK_ROWS:
+                yield pending
+                pending = []
+        else:
+            _collect_errors(all_errors, errors, stats)
+    yield pending
+
+
+def stream_validate_to_json(
+    csv_path: str,
+    output_path: str,
+    jobs: int = 1
+) -> tuple[list[str], dict[str, int | dict[str, int]]]:
+    """Validate a CSV file and write its valid rows to JSON as they are read.
+
+    Memory use stays bounded by VALIDATE_CHUNK_ROWS instead of growing with the
+    file. The output has the same layout as save_json. Unlike main(), invalid
+    rows do not stop the output from being written; they are only reported.
+
+    Args:
+        csv_path: Path to CSV file
+        output_path: Path to output JSON file
+        jobs: Number of worker processes for large files (see iter_validate)
+
+    Returns:
+        Tuple of (errors, statistics), errors capped as in load_and_validate_csv
+    """
+    all_errors: list[str] = []
+    stats = _new_stats()
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with open(output_path, 'wb') as out:
+            out.writelines(iter_json_array(_iter_converted_batches(csv_path, jobs, stats, all_errors)))
+
+        return all_errors, stats
+
+    except CSVSchemaError as e:
+        return [str(e)], stats
+    except FileNotFoundError:
+        return [f"File not found: {csv_path}"], stats
+    except (IOError, OSError, csv.Error, UnicodeDecodeError) as e:  # noqa: UP024
+        return [f"Error reading CSV file: {str(e)}"], stats
+
+
+def stream_validate_to_parquet(
+    csv_path: str,
+    output_path: str,
+    jobs: int = 1
+) -> tuple[list[str], dict[str, int | dict[str, int]]]:
+    """Validate a CSV file and write its valid rows to a Parquet file as they are read.
+
+    Same as stream_validate_to_json, but each batch becomes a row group of a
+    zstd-compressed Parquet file with a fixed schema (see parquet_schema);
+    optional fields a row leaves out are stored as nulls. Requires pyarrow.
+
+    Args:
+        csv_path: Path to CSV file
+        output_path: Path to output Parquet file
+        jobs: Number of worker processes for large files (see iter_validate)
+
+    Returns:
+        Tuple of (errors, statistics), errors capped as in load_and_validate_csv
+    """
+    all_errors: list[str] = []
+    stats = _new_stats()
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        schema = parquet_schema()
+        with pq.ParquetWriter(output_path, schema, compression='zstd') as writer:
+            for batch in _iter_converted_batches(csv_path, jobs, stats, all_errors):
+                if batch:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+
+        return all_errors, stats
+
+    except CSVSchemaError as e:
+        return [str(e)], stats
+    except FileNotFoundError:
+        return [f"File not found: {csv_path}"], stats
+    except (IOError, OSError, csv.Error, UnicodeDecodeError) as e:  # noqa: UP024
+        return [f"Error reading CSV file: {str(e)}"], stats
+
+
+def parquet_schema() -> 'pa.Schema':
+    """Arrow schema of converted rows, in ALL_FIELDS order.
+
+    Returns:
+        Schema with the timestamp and text fields as strings and all numeric
+        fields as float64; only the optional fields are nullable
+    """
+    text_fields = {'timestamp', 'id', 'city', 'provider'}
+    return pa.schema([
+        pa.field(field, pa.string() if field in text_fields else pa.float64(), nullable=field not in REQUIRED_FIELDS)
+        for field in ALL_FIELDS
+    ])
+
+
+def convert_row(row: dict[str, str]) -> dict[str, str | float]:
+    """Convert one validated CSV row to JSON format.
+
+    Args:
+        row: Validated CSV row
+
+    Returns:
+        Dictionary in JSON format
+    """
+    entry: dict[str, str | float] = {
+        'timestamp': row['timestamp'],
+        'latitude': float(row['latitude']),
+        'longitude': float(row['longitude']),
+        'download': float(row['download']),
+        'upload': float(row['upload'])
+    }
+
+    # Add optional fields if present
+    if row.get('id'):
+        entry['id'] = row['id']
+    if row.get('city'):
+        entry['city'] = row['city']
+    if row.get('provider'):
+        entry['provider'] = row['provider']
+    # validate_optional_numeric accepts whitespace-only values as empty
+    for field in OPTIONAL_NUMERIC_FIELDS:
+        value = row.get(field)
+        if value and not value.isspace():
+            entry[field] = float(value)
+
+    return entry
+
+
 def convert_to_json(rows: list[dict[str, str]]) -> list[dict[str, str | float]]:
     """Convert CSV rows to JSON format.
 
@@ -262,39 +810,41 @@ def convert_to_json(rows: list[dict[str, str]]) -> list[dict[str, str | float]]:
     Returns:
         List of dictionaries in JSON format
     """
-    json_data: list[dict[str, str | float]] = []
-
-    for row in rows:
-        entry: dict[str, str | float] = {
-            'timestamp': row['timestamp'],
-            'latitude': float(row['latitude']),
-            'longitude': float(row['longitude']),
-            'download': float(row['download']),
-            'upload': float(row['upload'])
-        }
-
-        # Add optional fields if present
-        if row.get('id'):
-            entry['id'] = row['id']
-        if row.get('city'):
-            entry['city'] = row['city']
-        if row.get('provider'):
-            entry['provider'] = row['provider']
-        if row.get('latency'):
-            entry['latency'] = float(row['latency'])
-        if row.get('jitter'):
-            entry['jitter'] = float(row['jitter'])
-        if row.get('packet_loss'):
-            entry['packet_loss'] = float(row['packet_loss'])
-
-        json_data.append(entry)
-
-    return json_data
+    return [convert_row(row) for row in rows]
+
+
+def iter_json_array(batches: Iterable[list[dict[str, str | float]]]) -> Iterator[bytes]:
+    """Encode batches of entries as the parts of one indented JSON array.
+
+    Each batch is encoded on its own by src.utils.data_utils.dumps_json and
+    spliced in without its brackets, so only one batch is held in encoded
+    form at a time. The concatenated parts have the same layout as
+    dumps_json of all entries.
+
+    Args:
+        batches: Lists of dictionaries, in output order; empty lists are skipped
+
+    Yields:
+        Consecutive byte chunks of the JSON document
+    """
+    # Imported here so worker processes spawned for --jobs, which never
+    # encode JSON, don't load the src.utils package
+    from src.utils.data_utils import dumps_json
+
+    separator = b'['
+    for batch in batches:
+        if batch:
+            yield separator + dumps_json(batch)[1:-2]
+            separator = b','
+    yield b'\n]' if separator == b',' else b'[]'
 
 
 def save_json(data: list[dict[str, str | float]], output_path: str) -> None:
     """Save data to JSON file.
 
+    Entries are encoded VALIDATE_CHUNK_ROWS at a time, so the full document
+    is never held in memory.
+
     Args:
         data: List of dictionaries to save
         output_path: Path to output JSON file
@@ -302,8 +852,9 @@ def save_json(data: list[dict[str, str | float]], output_path: str) -> None:
     # Create directory if it doesn't exist
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    batches = (data[start:start + VALIDATE_CHUNK_ROWS] for start in range(0, len(data), VALIDATE_CHUNK_ROWS))
+    with open(output_path, 'wb') as f:
+        f.writelines(iter_json_array(batches))
 
 
 def print_validation_report(stats: dict[str, int | dict[str, int]], errors: list[str], verbose: bool = False) -> None:
@@ -314,30 +865,37 @@ def print_validation_report(stats: dict[str, int | dict[str, int]], errors: list
         errors: List of validation errors
         verbose: Whether to print detailed error messages
     """
-    print("\n" + "=" * 80)
-    print("CSV VALIDATION REPORT")
-    print("=" * 80)
-    print(f"\nTotal rows processed: {stats['total_rows']}")
-    print(f"Valid rows: {stats['valid_rows']}")
-    print(f"Invalid rows: {stats['invalid_rows']}")
+    # Built as one string so the report goes out in a single write
+    lines = [
+        "",
+        "=" * 80,
+        "CSV VALIDATION REPORT",
+        "=" * 80,
+        f"\nTotal rows processed: {stats['total_rows']}",
+        f"Valid rows: {stats['valid_rows']}",
+        f"Invalid rows: {stats['invalid_rows']}"
+    ]
 
     missing_fields = stats['missing_optional_fields']
     if missing_fields and isinstance(missing_fields, dict):
-        print("\nOptional fields summary:")
-        for field, count in missing_fields.items():
-            print(f"  - {field}: missing in {count} row(s)")
+        lines.append("\nOptional fields summary:")
+        lines.extend(f"  - {field}: missing in {count} row(s)" for field, count in missing_fields.items())
 
     if errors:
-        print(f"\n[WARNING] Found {len(errors)} validation error(s):")
+        # Read and schema errors are reported without going through the row statistics
+        error_count = stats['total_errors'] if stats.get('errors_truncated') else len(errors)
+        lines.append(f"\n[WARNING] Found {error_count} validation error(s):")
+        if stats.get('errors_truncated'):
+            lines.append(f"  (Only the first {len(errors)} error messages were kept)")
         if verbose:
-            for error in errors[:MAX_ERRORS_DISPLAYED]:
-                print(f"  - {error}")
-            if len(errors) > MAX_ERRORS_DISPLAYED:
-                print(f"  ... and {len(errors) - MAX_ERRORS_DISPLAYED} more error(s)")
+            lines.extend(f"  - {error}" for error in errors[:MAX_ERRORS_DISPLAYED])
+            if error_count > MAX_ERRORS_DISPLAYED:
+                lines.append(f"  ... and {error_count - MAX_ERRORS_DISPLAYED} more error(s)")
         else:
-            print("  (Use --verbose to see detailed error messages)")
+            lines.append("  (Use --verbose to see detailed error messages)")
 
-    print("=" * 80 + "\n")
+    lines.append("=" * 80 + "\n")
+    print("\n".join(lines))
 
 
 def main():
@@ -350,6 +908,8 @@ Examples:
   python upload_csv.py example_speedtests.csv
   python upload_csv.py my_data.csv --output results.json
   python upload_csv.py data.csv --verbose --dry-run
+  python upload_csv.py large_data.csv --jobs 4
+  python upload_csv.py data.csv --format parquet --output data.parquet
 
 Required CSV columns:
   timestamp, latitude, longitude, download, upload
@@ -367,7 +927,7 @@ Optional CSV columns:
     parser.add_argument(
         '--output', '-o',
         default='speedtest_data.json',
-        help='Output JSON file path (default: speedtest_data.json)'
+        help='Output file path (default: speedtest_data.json)'
     )
 
     parser.add_argument(
@@ -382,7 +942,23 @@ Optional CSV columns:
         help='Validate CSV without saving output file'
     )
 
+    parser.add_argument(
+        '--format', '-f',
+        choices=['json', 'parquet'],
+        default='json',
+        help='Output file format; parquet requires pyarrow (default: json)'
+    )
+
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for validating files of 10 MB or more (default: 1)'
+    )
+
     args = parser.parse_args()
+    if args.format == 'parquet' and not PYARROW_AVAILABLE:
+        parser.error("--format parquet requires pyarrow (pip install pyarrow)")
 
     # Print header
     print("\n*** Rural Connectivity Mapper 2026 - CSV Upload Script ***")
@@ -392,29 +968,33 @@ Optional CSV columns:
     else:
         print("Mode: Dry-run (validation only)")
 
-    # Load and validate CSV
+    # Validate CSV, streaming valid rows to a temporary file next to the output
     print("\nValidating CSV file...")
-    valid_rows, errors, stats = load_and_validate_csv(args.csv_file)
+    if args.dry_run:
+        _, errors, stats = load_and_validate_csv(args.csv_file, args.jobs)
+    else:
+        output_path = Path(args.output)
+        partial_path = output_path.with_name(output_path.name + '.tmp')
+        stream_validate = stream_validate_to_parquet if args.format == 'parquet' else stream_validate_to_json
+        errors, stats = stream_validate(args.csv_file, str(partial_path), args.jobs)
 
     # Print validation report
     print_validation_report(stats, errors, args.verbose)
 
     # Exit if there are errors
-    if errors:
-        print("[ERROR] Validation failed. Please fix the errors above and try again.\n")
-        sys.exit(1)
-
-    if stats['valid_rows'] == 0:
-        print("[ERROR] No valid rows found in CSV file.\n")
+    if errors or stats['valid_rows'] == 0:
+        if not args.dry_run:
+            partial_path.unlink(missing_ok=True)
+        if errors:
+            print("[ERROR] Validation failed. Please fix the errors above and try again.\n")
+        else:
+            print("[ERROR] No valid rows found in CSV file.\n")
         sys.exit(1)
 
-    # Convert to JSON format
-    json_data = convert_to_json(valid_rows)
-
-    # Save to file unless dry-run
+    # Only a fully valid file replaces the output
     if not args.dry_run:
-        print(f"Saving {len(json_data)} record(s) to {args.output}...")
-        save_json(json_data, args.output)
+        print(f"Saving {stats['valid_rows']} record(s) to {args.output}...")
+        partial_path.replace(output_path)
         print(f"[SUCCESS] Successfully saved data to {args.output}")
     else:
         print("[SUCCESS] Validation successful! (Dry-run mode - no file saved)")